@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Generators for synthetic configuration files and matching data models"""
+from schema import node
+from schema.mixins import children, ref
+
+
+class Target(object):
+    """Object populated by generated data models"""
+    pass
+
+
+def names(depth, width, prefix=""):
+    """Iterate over the layout of a generated configuration
+    
+    Each branch contains ``width`` values followed by ``width`` sub-branches
+    down to the given depth.
+    
+    Arguments:
+        depth (int): Number of branch levels below the root
+        width (int): Number of values and sub-branches per branch
+        prefix (str): Prefix of attribute names
+        
+    Yield:
+        tuple: ``(level, kind, name, attr)``, where kind is one of 'value',
+        'enter' or 'leave' and attr is the unique attribute name of values.
+    """
+    for i in range(width):
+        name= "value{0:d}".format(i)
+        yield 0, "value", name, "{0}{1}".format(prefix, name)
+
+    if depth == 0:
+        return
+
+    for i in range(width):
+        name= "section{0:d}".format(i)
+        yield 0, "enter", name, None
+        for level, kind, child, attr in names(depth - 1, width,
+                                              "{0}{1}_".format(prefix, name)):
+            yield level + 1, kind, child, attr
+        yield 0, "leave", name, None
+
+
+def value(attr, length):
+    """Get value of given length for an attribute"""
+    return (attr * (length // len(attr) + 1))[:length]
+
+
+def defaultConfig(depth, width, valueLength, indent=2):
+    """Generate configuration in the format of :class:`~schema.DefaultReader`
+    
+    Arguments:
+        depth (int): Number of nested section levels
+        width (int): Number of values and sections per section
+        valueLength (int): Number of characters per value
+        indent (int): Number of spaces per indentation level
+        
+    Return:
+        str: Configuration
+    """
+    lines= []
+    
+    for level, kind, name, attr in names(depth, width):
+        padding= " " * (indent * level)
+        if kind == "value":
+            lines.append("{0}{1}= {2}  # comment\n"
+                         .format(padding, name, value(attr, valueLength)))
+        elif kind == "enter":
+            lines.append("{0}{1} {{\n".format(padding, name))
+        else:
+            lines.append("{0}}}\n".format(padding))
+
+    return "".join(lines)
+
+
+def deepConfig(depth, valueLength, indent=2):
+    """Generate deeply nested configuration for :class:`~schema.DefaultReader`
+    
+    Each section contains a single value followed by a single sub-section.
+    
+    Arguments:
+        depth (int): Number of nested section levels
+        valueLength (int): Number of characters per value
+        indent (int): Number of spaces per indentation level
+        
+    Return:
+        str: Configuration
+    """
+    lines= []
+    
+    for level in range(depth):
+        padding= " " * (indent * level)
+        lines.append("{0}value= {1}\n".format(padding,
+                                               value("value", valueLength)))
+        lines.append("{0}section {{\n".format(padding))
+
+    for level in reversed(range(depth)):
+        lines.append("{0}}}\n".format(" " * (indent * level)))
+
+    return "".join(lines)
+
+
+def iniConfig(sections, width, valueLength):
+    """Generate configuration in the format of :class:`~schema.IniReader`
+    
+    Arguments:
+        sections (int): Number of sections
+        width (int): Number of values per section
+        valueLength (int): Number of characters per value
+        
+    Return:
+        str: Configuration
+    """
+    lines= [ "value{0:d} = {1}\n".format(j, value("value{0:d}".format(j),
+                                                   valueLength))
+             for j in range(width) ]
+
+    for i in range(sections):
+        lines.append("\n[section{0:d}]  ; comment\n".format(i))
+        for j in range(width):
+            attr= "section{0:d}_value{1:d}".format(i, j)
+            lines.append("  value{0:d} = {1}\n"
+                         .format(j, value(attr, valueLength)))
+        
+    return "".join(lines)
+
+
+def defaultSchema(depth, width):
+    """Create data model for :func:`defaultConfig`
+    
+    Arguments:
+        depth (int): Number of nested section levels
+        width (int): Number of values and sections per section
+        
+    Return:
+        tuple: Pair ``(context, target)`` of root context and the object
+        populated by it
+    """
+    target= Target()
+    stack= [[]]
+
+    for level, kind, name, attr in names(depth, width):
+        if kind == "value":
+            stack[-1].append( node(name) << ref(target, attr) )
+        elif kind == "enter":
+            stack.append([name])
+        else:
+            items= stack.pop()
+            stack[-1].append( node(items[0]) << children()[tuple(items[1:])] )
+
+    return node("root") << children()[tuple(stack[0])], target
+
+
+def iniSchema(sections, width):
+    """Create data model for :func:`iniConfig`
+    
+    Arguments:
+        sections (int): Number of sections
+        width (int): Number of values per section
+        
+    Return:
+        tuple: Pair ``(context, target)``
+    """
+    target= Target()
+    items= [ node("value{0:d}".format(j))
+             << ref(target, "value{0:d}".format(j)) for j in range(width) ]
+    
+    for i in range(sections):
+        items.append( node("section{0:d}".format(i)) << children()[
+                        tuple( node("value{0:d}".format(j))
+                               << ref(target, "section{0:d}_value{1:d}"
+                                              .format(i, j))
+                               for j in range(width) ) ] )
+
+    return node("root") << children()[tuple(items)], target
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os, sys
+import json
+from argparse import ArgumentParser
+
+
+def main(argv=None):
+    benchRoot= os.path.abspath( os.path.dirname(__file__) )
+    libDir= os.path.dirname(benchRoot)
+    
+    if libDir not in sys.path:
+        sys.path.insert(0, libDir)
+
+    from benchmarks.suite import BENCHMARKS, MEMORY_BENCHMARKS, DEFAULTS, run
+
+    parser= ArgumentParser(description="Run benchmarks and print results as "
+                                       "JSON")
+    known= list(BENCHMARKS) + list(MEMORY_BENCHMARKS)
+    parser.add_argument("names", nargs="*", metavar="name",
+                        help="Benchmarks to run. Defaults to all. Available: "
+                             + ", ".join(known))
+    parser.add_argument("--depth", type=int, default=DEFAULTS["depth"],
+                        help="Nesting depth of generated configurations")
+    parser.add_argument("--width", type=int, default=DEFAULTS["width"],
+                        help="Values and sections per section")
+    parser.add_argument("--value-length", type=int, dest="valueLength",
+                        default=DEFAULTS["valueLength"],
+                        help="Number of characters per value")
+    parser.add_argument("--deep-depth", type=int, dest="deepDepth",
+                        default=DEFAULTS["deepDepth"],
+                        help="Nesting depth of deeply nested documents")
+    parser.add_argument("--line-values", type=int, dest="lineValues",
+                        default=DEFAULTS["lineValues"],
+                        help="Number of values in a single long line")
+    parser.add_argument("--repeat", type=int, default=DEFAULTS["repeat"],
+                        help="Number of timed runs per benchmark")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Output file. Defaults to stdout.")
+    args= parser.parse_args(argv)
+    unknown= [name for name in args.names if name not in known]
+
+    if unknown:
+        parser.error("unknown benchmark(s): " + ", ".join(unknown))
+    
+    params= vars(args)
+    names = params.pop("names")
+    output= params.pop("output")
+    results= run(names, **params)
+
+    if output is None:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for readers, validator and writers
+
+Each benchmark is a function decorated with :func:`benchmark`. It receives
+the benchmark parameters, performs all preparation and returns a callable
+without arguments, which is timed by :func:`run`.
+
+Memory benchmarks are decorated with :func:`memoryBenchmark`. The returned
+callable creates the objects to measure and returns them along with their
+number.
+"""
+import sys
+import gc
+import platform
+import tracemalloc
+from io import StringIO
+from xml.sax import parseString
+from timeit import repeat
+from statistics import mean, stdev
+
+from schema import DefaultReader, IniReader, Validator, DefaultWriter, \
+                   Schema, IncrementalValidator
+from schema.content_handler import ContentHandler
+from schema.event_cache import EventRecorder, replay
+from schema.schema_reader import SchemaReader
+from schema.xml import XmlWriter, SaxReader, ExpatReader
+
+from .generate import defaultConfig, defaultSchema, iniConfig, iniSchema, \
+                      names, deepConfig
+
+#Registry of benchmarks in order of definition
+BENCHMARKS= dict()
+
+#Registry of memory benchmarks in order of definition
+MEMORY_BENCHMARKS= dict()
+
+#Default parameters
+DEFAULTS= { "depth"      : 3,
+            "width"      : 8,
+            "valueLength": 16,
+            "deepDepth"  : 1000,
+            "lineValues" : 64000,
+            "repeat"     : 5 }
+
+
+def benchmark(func):
+    """Register benchmark function
+    
+    Arguments:
+        func (callable): Function accepting the parameters as keyword
+            arguments and returning the callable to time.
+            
+    Return:
+        callable: ``func``
+    """
+    BENCHMARKS[func.__name__]= func
+    return func
+
+
+def memoryBenchmark(func):
+    """Register memory benchmark function
+    
+    Arguments:
+        func (callable): Function accepting the parameters as keyword
+            arguments and returning a callable, which returns a pair
+            ``(objects, count)``.
+            
+    Return:
+        callable: ``func``
+    """
+    MEMORY_BENCHMARKS[func.__name__]= func
+    return func
+
+
+def sections(depth, width):
+    """Number of INI sections equivalent in size to a default configuration"""
+    return sum(width**i for i in range(1, depth + 1))
+
+
+def events(depth, width, valueLength):
+    """Record the events produced by reading a default configuration"""
+    recorder= EventRecorder()
+    DefaultReader(recorder).parseBuffer(defaultConfig(depth, width,
+                                                      valueLength))
+    return recorder.recorded
+
+
+def nodes(depth, width):
+    """Number of contexts in data model created by :func:`defaultSchema`"""
+    return 1 + sum(1 for level, kind, name, attr in names(depth, width)
+                   if kind != "leave")
+
+
+@benchmark
+def defaultReader(depth, width, valueLength, **kwargs):
+    """Tokenize default configuration line by line"""
+    lines= defaultConfig(depth, width, valueLength).splitlines(True)
+    reader= DefaultReader(ContentHandler())
+    return lambda: reader.parse(lines)
+
+
+@benchmark
+def defaultReaderBuffer(depth, width, valueLength, **kwargs):
+    """Tokenize default configuration held in a single buffer"""
+    text= defaultConfig(depth, width, valueLength)
+    reader= DefaultReader(ContentHandler())
+    return lambda: reader.parseBuffer(text)
+
+
+@benchmark
+def defaultReaderLongLine(lineValues, **kwargs):
+    """Tokenize a single line holding a long list of values"""
+    text= "values= {0}\n".format(", ".join(["12345"] * lineValues))
+    reader= DefaultReader(ContentHandler())
+    return lambda: reader.parse([text])
+
+
+@benchmark
+def iniReader(depth, width, valueLength, **kwargs):
+    """Tokenize INI configuration"""
+    text= iniConfig(sections(depth, width), width, valueLength)
+    reader= IniReader(ContentHandler())
+    return lambda: reader.parseBuffer(text)
+
+
+@benchmark
+def validator(depth, width, valueLength, **kwargs):
+    """Populate data model from default configuration"""
+    text= defaultConfig(depth, width, valueLength)
+    context, target= defaultSchema(depth, width)
+    reader= DefaultReader(Validator(context))
+    return lambda: reader.parseBuffer(text)
+
+
+@benchmark
+def validatorCompiled(depth, width, valueLength, **kwargs):
+    """Populate data model from default configuration using compiled schema"""
+    text= defaultConfig(depth, width, valueLength)
+    context, target= defaultSchema(depth, width)
+    reader= DefaultReader(Validator(context, compiled=True))
+    return lambda: reader.parseBuffer(text)
+
+
+@benchmark
+def validatorIncremental(depth, width, valueLength, **kwargs):
+    """Reload default configuration with a single changed value"""
+    text= defaultConfig(depth, width, valueLength)
+    pos= text.index("= ") + 2
+    changed= text[:pos] + "-" + text[pos + 1:]
+    context, target= defaultSchema(depth, width)
+    reader= DefaultReader(IncrementalValidator(context))
+    reader.parseBuffer(text)
+    texts= [text, changed]
+
+    def reload():
+        texts.reverse()
+        reader.parseBuffer(texts[0])
+
+    return reload
+
+
+@benchmark
+def validatorIni(depth, width, valueLength, **kwargs):
+    """Populate data model from INI configuration"""
+    n= sections(depth, width)
+    text= iniConfig(n, width, valueLength)
+    context, target= iniSchema(n, width)
+    reader= IniReader(Validator(context))
+    return lambda: reader.parseBuffer(text)
+
+
+@benchmark
+def schemaReader(depth, width, valueLength, **kwargs):
+    """Write populated data model to XML and read it back"""
+    context, target= defaultSchema(depth, width)
+    DefaultReader(Validator(context)).parseBuffer(
+        defaultConfig(depth, width, valueLength) )
+    schema= Schema(context)
+    
+    def roundTrip():
+        out= StringIO()
+        SchemaReader(XmlWriter(os=out))(schema)
+        parseString(out.getvalue().encode("utf-8"), SaxReader(Validator(schema)))
+        
+    return roundTrip
+
+
+def xmlDocument(depth, width, valueLength):
+    """Convert a default configuration to XML"""
+    out= StringIO()
+    DefaultReader(XmlWriter(os=out)).parseBuffer(defaultConfig(depth, width,
+                                                               valueLength))
+    return out.getvalue().encode("utf-8")
+
+
+@benchmark
+def saxValidator(depth, width, valueLength, **kwargs):
+    """Populate data model from XML using SaxReader"""
+    data= xmlDocument(depth, width, valueLength)
+    context, target= defaultSchema(depth, width)
+    return lambda: parseString(data, SaxReader(Validator(context)))
+
+
+@benchmark
+def expatValidator(depth, width, valueLength, **kwargs):
+    """Populate data model from XML using ExpatReader"""
+    data= xmlDocument(depth, width, valueLength)
+    context, target= defaultSchema(depth, width)
+    reader= ExpatReader(Validator(context))
+    return lambda: reader.parseBuffer(data)
+
+
+@benchmark
+def defaultWriter(depth, width, valueLength, **kwargs):
+    """Write recorded events with DefaultWriter"""
+    stream= events(depth, width, valueLength)
+    return lambda: replay(stream, DefaultWriter(os=StringIO()))
+
+
+@benchmark
+def xmlWriter(depth, width, valueLength, **kwargs):
+    """Write recorded events with XmlWriter"""
+    stream= events(depth, width, valueLength)
+    return lambda: replay(stream, XmlWriter(os=StringIO()))
+
+
+@benchmark
+def defaultWriterDeep(deepDepth, valueLength, **kwargs):
+    """Write recorded events of a deeply nested document with DefaultWriter"""
+    recorder= EventRecorder()
+    DefaultReader(recorder).parseBuffer(deepConfig(deepDepth, valueLength))
+    return lambda: replay(recorder.recorded, DefaultWriter(os=StringIO()))
+
+
+@benchmark
+def xmlWriterDeep(deepDepth, valueLength, **kwargs):
+    """Write recorded events of a deeply nested document with XmlWriter"""
+    recorder= EventRecorder()
+    DefaultReader(recorder).parseBuffer(deepConfig(deepDepth, valueLength))
+    return lambda: replay(recorder.recorded, XmlWriter(os=StringIO()))
+
+
+@benchmark
+def schemaConstruction(depth, width, **kwargs):
+    """Create data model for default configuration"""
+    return lambda: defaultSchema(depth, width)
+
+
+@memoryBenchmark
+def schemaMemory(depth, width, **kwargs):
+    """Memory used by data model for default configuration"""
+    return lambda: (defaultSchema(depth, width), nodes(depth, width))
+
+
+def measureMemory(func):
+    """Measure memory allocated by objects created by a callable
+    
+    Arguments:
+        func (callable): Callable returning a pair ``(objects, count)``
+        
+    Return:
+        dict: Total number of bytes, number of objects and bytes per object
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects, count= func()
+        gc.collect()
+        size= tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return { "bytes"        : size,
+             "count"        : count,
+             "bytesPerCount": size / count }
+
+
+def run(names=None, **kwargs):
+    """Run benchmarks
+    
+    Arguments:
+        names (iterable): Names of benchmarks to run. Defaults to all.
+        **kwargs: Parameters overriding :data:`DEFAULTS`
+        
+    Return:
+        dict: Machine readable results containing the parameters, for each
+        benchmark minimum, mean and standard deviation of the run time in
+        seconds and for each memory benchmark the allocated memory.
+    """
+    params= dict(DEFAULTS)
+    params.update(kwargs)
+    results= dict()
+    memory= dict()
+    
+    if not names:
+        names= list(BENCHMARKS) + list(MEMORY_BENCHMARKS)
+
+    for name in names:
+        if name in MEMORY_BENCHMARKS:
+            memory[name]= measureMemory( MEMORY_BENCHMARKS[name](**params) )
+            continue
+
+        func= BENCHMARKS[name](**params)
+        times= repeat(func, number=1, repeat=params["repeat"])
+        results[name]= { "min"  : min(times),
+                         "mean" : mean(times),
+                         "stdev": stdev(times) if len(times) > 1 else 0.,
+                         "times": times }
+
+    return { "python"    : sys.version,
+             "platform"  : platform.platform(),
+             "parameters": params,
+             "results"   : results,
+             "memory"    : memory }
@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 #from .context_reader import ContextReader
 from .context import Context, ContextError, node
-from .schema import Schema
+from .schema import Schema, CompiledSchema
 from .error import SchemaError
 from .error_handler import ErrorHandler
 from .validator import Validator
+from .incremental_validator import IncrementalValidator
+from .event_batch import EventBatch
+from .event_cache import EventCache
+from .profiler import Profiler, ProfilingContentHandler
 from .default_reader import DefaultReader
 from .ini_reader import IniReader
 from .default_writer import DefaultWriter
@@ -1,5 +1,12 @@
 # -*- coding: utf-8 -*-
 
+#Opcodes of events passed to ContentHandler.events
+ENTER  = 1 #: payload: tuple (name, attributes dict)
+LEAVE  = 2 #: payload: None
+CONTENT= 3 #: payload: content string
+COMMENT= 4 #: payload: comment string
+IGNORE = 5 #: payload: ignorable string
+
 
 class ContentHandler(object):
     """Processes content obtained from a reader
@@ -13,7 +20,16 @@ class ContentHandler(object):
     implementations refer to
     * :class:`~schema.Validator`
     * :class:`~schema.XmlWriter`
+    
+    Attributes:
+        wantsIgnorable (bool): Whether this handler processes ignorable
+            content. If ``False``, readers may omit calls to :meth:`ignore`.
+        wantsComments (bool): Whether this handler processes comments. If
+            ``False``, readers may omit calls to :meth:`comment`.
     """
+    wantsIgnorable= True
+    wantsComments = True
+
     @property
     def locator(self):
         """Return the currently used locator
@@ -92,3 +108,33 @@ class ContentHandler(object):
                padding
         """
         return
+
+
+    def events(self, batch):
+        """Process a batch of events
+        
+        Batches are produced e.g. by :class:`~schema.EventBatch`. Each event
+        is a tuple ``(opcode, payload)``, where opcode is one of ``ENTER``,
+        ``LEAVE``, ``CONTENT``, ``COMMENT`` or ``IGNORE``. This default
+        implementation replays the events one by one using the respective
+        methods. Derived classes may override this method with a faster
+        implementation.
+        
+        Arguments:
+            batch (list): List of ``(opcode, payload)`` tuples. The list is
+               only valid for the duration of the call.
+        """
+        for opcode, payload in batch:
+            if opcode == CONTENT:
+                self.content(payload)
+            elif opcode == ENTER:
+                name, attrs= payload
+                self.enter(name, **attrs)
+            elif opcode == LEAVE:
+                self.leave()
+            elif opcode == IGNORE:
+                self.ignore(payload)
+            elif opcode == COMMENT:
+                self.comment(payload)
+            else:
+                raise ValueError("Invalid opcode: {}".format(opcode))
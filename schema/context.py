@@ -3,6 +3,34 @@
 class ContextError(RuntimeError):
     pass
 
+
+#Registry of types composed from a mixin type and a context type
+_composedTypes= dict()
+
+
+def composedType(mixinType, contextType):
+    """Get type derived from a mixin type and a context type
+    
+    Composed types are created once per combination and reused afterwards.
+    The name of a composed type is the concatenation of the names of its
+    bases, e.g. ``GroupContext``.
+    
+    Arguments:
+        mixinType (type): :class:`~schema.Mixin` derived type
+        contextType (type): :class:`~schema.Context` derived type
+        
+    Return:
+        type: Type derived from ``mixinType`` and ``contextType``
+    """
+    key= (mixinType, contextType)
+    T= _composedTypes.get(key)
+
+    if T is None:
+        T= type(mixinType.__name__ + contextType.__name__, key, {})
+        T= _composedTypes.setdefault(key, T)
+
+    return T
+
 #TODO Context should provide error handler interface, which mixins can use e.g.
 # to produce warnings. How do we obtain a locator ?
 # Mabe context should provide state flags instead of direct error output, which
@@ -89,11 +117,9 @@ class Context(object):
         Return:
             :class:~schema.Context`: ``self``
         """
-        #create anonymous new type, which is derived from mixin and the current
-        #type
-        T= type("", (type(mixin), type(self)), {})
-
-        self.__class__= T  #reset type of this object
+        #reset type of this object to a type derived from mixin and the
+        #current type
+        self.__class__= composedType(type(mixin), type(self))
         mixin.moveTo(self) #init mixin related attributes
 
         return self
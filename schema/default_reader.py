@@ -1,22 +1,146 @@
 # -*- coding: utf-8 -*-
 import re
+import codecs
+import asyncio
+from functools import lru_cache, partial
 from .content_buffer import ContentBuffer
 from .error_handler import ErrorHandler
+from .error import SchemaError
+from .event_batch import EventBatch
+
+
+@lru_cache(maxsize=64)
+def actionTable(cls, assignChar, commentChar):
+    """Get compiled default actions of a reader class
+    
+    Results are cached, so readers sharing class, assignment and comment
+    character share their compiled regular expressions.
+    
+    Arguments:
+        cls (type): :class:`~schema.DefaultReader` or derived class
+        assignChar (:class:`str`): Assignment character
+        commentChar (:class:`str`): Comment character
+        
+    Return:
+        tuple: Tuple of pairs (compiled regex, method name)
+    """
+    return tuple( (re.compile(pattern), name) for pattern, name
+                  in cls.defaultActions(assignChar, commentChar) )
+
+
+@lru_cache(maxsize=64)
+def compileScanner(patterns):
+    """Compile master regular expression for a sequence of patterns
+    
+    Arguments:
+        patterns (tuple): Tuple of regular expression pattern strings as
+            returned by :func:`embeddable`
+        
+    Return:
+        :class:`re.Pattern`: Alternation of all patterns, where the i-th
+        pattern forms the group named ``_i``.
+    """
+    return re.compile("|".join("(?P<_{0:d}>{1})".format(i, pattern)
+                               for i, pattern in enumerate(patterns)))
+
+
+#Inline flag letters of flags supported in scoped groups
+_FLAGS= ( (re.ASCII, "a"), (re.IGNORECASE, "i"), (re.MULTILINE, "m"),
+          (re.DOTALL, "s"), (re.VERBOSE, "x") )
+
+#Global inline flags at the start of a pattern
+_GLOBAL_FLAGS= re.compile(r"(?:\(\?[aiLmsux]+\))+")
+
+
+def embeddable(regex):
+    """Get pattern of a compiled expression suitable for the master expression
+    
+    Flags of the expression, whether passed to :func:`re.compile` or given as
+    global inline flags such as ``(?i)``, are moved into a scoped group
+    ``(?i:...)``, so they apply to this pattern only.
+    
+    Arguments:
+        regex (:class:`re.Pattern`): Compiled regular expression
+        
+    Return:
+        str: Pattern string
+    """
+    flags  = "".join(letter for flag, letter in _FLAGS if regex.flags & flag)
+    pattern= regex.pattern
+    match  = _GLOBAL_FLAGS.match(pattern)
+    
+    if match:
+        pattern= pattern[match.end():]
+
+    if not flags:
+        return pattern
+
+    return "(?{0}:{1})".format(flags, pattern)
+
+
+def rematch(regex, action):
+    """Adapt an action to be invoked with a match of its own pattern
+    
+    Arguments:
+        regex (:class:`re.Pattern`): Compiled pattern of action
+        action (callable): Callable accepting a match object of ``regex``
+        
+    Return:
+        callable: Callable accepting a match of the master expression and the
+        group offset of ``regex`` in this match
+    """
+    def adapter(match, offset):
+        return action(regex.match(match.string, match.pos, match.endpos))
+    return adapter
+
+
+def completeLines(parts, chunk):
+    """Get complete lines of a chunk of input
+    
+    Chunks without line break are only collected, so a long line spanning
+    many chunks is joined once, when it is complete.
+    
+    Arguments:
+        parts (list): Parts of the incomplete line of previous chunks.
+            Updated with the incomplete last line of ``chunk``.
+        chunk (str): Next chunk of input
+        
+    Return:
+        tuple: Pair ``(buffer, end)``, where ``buffer[:end]`` holds all
+        complete lines
+    """
+    end= chunk.rfind("\n") + 1
+
+    if not end:
+        if chunk:
+            parts.append(chunk)
+        return chunk, 0
+
+    if parts:
+        parts.append(chunk)
+        chunk= "".join(parts)
+        parts.clear()
+        end= chunk.rfind("\n") + 1
+
+    if end != len(chunk):
+        parts.append(chunk[end:])
+
+    return chunk, end
 
 
 class Locator(object):
     """Simple locator used by :class:`~schema.DefaultReader`
     """
     def __init__(self):
-        self.row= 0
-        self.col= 0
+        self.line  = 0
+        self.column= 0
         
     def __str__(self):
         """Convert current locator to string
         
         This method is used by various error reporting routines
         """
-        return "{:d}:{:d}".format(self.row, self.col)
+        return "{:d}:{:d}".format(self.line, self.column)
 
 
 class DefaultReader(ErrorHandler):
@@ -26,11 +150,17 @@ class DefaultReader(ErrorHandler):
         contentHandler (:class:`~.ContentHandler`): Content handler object.   
         assignChar (:class:`str`): Assignment character. Defaults to '='.
         commentChar (:class:`str`): Comment character. Defaults to '#'.
+        batchSize (int): If non-zero, events are passed to the content
+           handler in batches of about this size using an
+           :class:`~schema.EventBatch`. Defaults to 0.
     """
-    def __init__(self, contentHandler, assignChar= "=", commentChar= "#"):
+    def __init__(self, contentHandler, assignChar= "=", commentChar= "#",
+                 batchSize=0):
         super().__init__(name="schema.DefaultReader")
         self._impl            = contentHandler
         self._actions         = list()
+        self._scanner         = None #: Master regex combining all actions
+        self._dispatch        = list() #: Group index -> action
         self._locator         = Locator()
         self._onLhs           = True #: Whether or not we are on left-hand side of expr
         self._inAttributes    = False #: Whether we are parsing attributes
@@ -39,9 +169,48 @@ class DefaultReader(ErrorHandler):
         self._attributes      = dict()
         self._currentAttribute= None
         self._stack           = list()
+        self._wantsIgnorable  = True #: Whether handler processes ignorables
+        self._wantsComments   = True #: Whether handler processes comments
+
+        if batchSize:
+            self._impl= EventBatch(contentHandler, size=batchSize)
 
         # Default actions
-        self.actions([
+        self._actions.extend( (regex, getattr(self, name)) for regex, name
+                              in actionTable(type(self), assignChar,
+                                             commentChar) )
+
+
+    @property
+    def locator(self):
+        """Return the locator of this reader
+        
+        Return:
+            :class:`~schema.default_reader.Locator`: Locator object
+        """
+        return self._locator
+
+
+    @classmethod
+    def defaultActions(cls, assignChar, commentChar):
+        """Get default actions of this reader
+        
+        Derived readers may override this method to replace the default
+        actions. The compiled actions are cached per class and character
+        combination by :func:`actionTable`.
+        
+        Methods are invoked as ``method(match, offset)`` with the match of the
+        master expression (see :meth:`scanner`), where group ``i`` of the
+        pattern is ``match.group(offset + i)``.
+        
+        Arguments:
+            assignChar (:class:`str`): Assignment character
+            commentChar (:class:`str`): Comment character
+            
+        Return:
+            list: List of pairs (pattern, method name) in order of precedence
+        """
+        return [
             (r"{0}(.*)".format(commentChar), "comment"),
             (r"[\t ]*(\r?\n)", "newline"),
             (r"([\t ]*)'([^']*)[\t ]*'", "quoted_identifier"),
@@ -58,39 +227,215 @@ class DefaultReader(ErrorHandler):
             (r"([\ ]*)([^\s{0}{{}}\[\],;{1}\(\)]+)[\t *]*"
               .format(assignChar, commentChar), "identifier"),
             (r"([\t ]+)", "ignore")
-        ])
+        ]
 
 
     def actions(self, actions):
         """Register regular expression for a method
         
         Assigns a regular expression to a class method to execute, when the
-        regular expression matches an input line.
+        regular expression matches an input line. Flags, including global
+        inline flags such as ``(?i)``, apply to the respective pattern only.
         
         Arguments:
-            name (str): Name of class method to invoke. The method is invoked
-               with a match object as single parameter.
-            pattern (str): Regular expression pattern to match.
+            actions (iterable): Pairs (pattern, name), where pattern is a
+               regular expression pattern string or a compiled expression
+               and name is the name of the class method to invoke. The method
+               is invoked with a match object as single parameter.
+               
+        Raises:
+            ValueError: If a pattern defines a group name already defined by
+               another action or a name of the form ``_<number>`` reserved
+               for the master expression (see :meth:`scanner`).
         """
+        names= set()
+        for regex, action in self._actions:
+            names.update(regex.groupindex)
+
         for pattern, name in actions:
-            self._actions.append((re.compile(pattern), getattr(self, name))) 
-        
+            regex= re.compile(pattern)
+
+            for group in regex.groupindex:
+                if group in names or re.fullmatch(r"_\d+", group):
+                    raise ValueError("Group name '{0}' of pattern '{1}' is "
+                                     "reserved or already in use"
+                                     .format(group, regex.pattern))
+                names.add(group)
+
+            self._actions.append((regex, rematch(regex, getattr(self, name))))
+
+        self._scanner= None #rebuilt on next call to tokenize
+
+
+    def scanner(self):
+        """Get master regular expression combining all registered actions
+
+        All patterns registered via :meth:`actions` are merged into a single
+        alternation of named groups in the order of registration. Matching the
+        master expression is thus equivalent to trying each pattern in turn,
+        but requires a single call into the regular expression engine. The
+        expression is built lazily and kept until :meth:`actions` is invoked
+        again. Compiled expressions are shared between readers with identical
+        actions.
+
+        Each token is matched only once. Default actions receive the match of
+        the master expression and the offset of their pattern's group.
+        Actions registered via :meth:`actions` re-match their own pattern, so
+        they receive a match object of that pattern. Flags of a pattern are
+        moved into a scoped group by :func:`embeddable`.
+
+        Note:
+            Numbered back references (``\\1``) refer to the groups of the
+            master expression and are not supported. Group names must be
+            unique across all actions. Patterns are matched at the current
+            column of the unsliced line, so ``^`` anchors only match at the
+            start of a line.
+
+        Return:
+            :class:`re.Pattern`: Compiled master expression. The index of the
+            outermost matching group (``match.lastindex``) identifies the
+            action to invoke.
+        """
+        if self._scanner is None:
+            scanner= compileScanner( tuple(embeddable(regex) for regex, action
+                                           in self._actions) )
+            self._dispatch= [None] * (scanner.groups + 1)
+            
+            for i, (regex, action) in enumerate(self._actions):
+                self._dispatch[scanner.groupindex["_{0:d}".format(i)]]= action
+
+            self._scanner= scanner
+
+        return self._scanner
+
         
     def parse(self, inputStream):
+        """Parse input stream
+        
+        Arguments:
+            inputStream: Iterable of lines, e.g. a file opened in text mode.
+        """
         self.startDocument()
         self.tokenize(inputStream)
         self.endDocument()        
+
+
+    def iterParse(self, inputStreams):
+        """Parse several documents in turn reusing this reader and its handler
         
+        Generator parsing one document per iteration. Nothing is parsed unless
+        the generator is consumed. The content handler is re-opened and the
+        error counters :attr:`nErrors` and :attr:`nWarnings` are reset for
+        each document, so results have to be read before advancing to the
+        next document.
         
+        Arguments:
+            inputStreams: Iterable of input streams accepted by :meth:`parse`
+            
+        Yield:
+            Each input stream after it has been parsed
+        """
+        for inputStream in inputStreams:
+            self.parse(inputStream)
+            yield inputStream
+
+
+    def parseBuffer(self, buffer, encoding="utf-8"):
+        """Parse an entire document held in memory
+        
+        The buffer is decoded once and tokenized in a single scan without
+        splitting it into individual line strings. Lines are separated by
+        ``'\\n'``.
+        
+        Arguments:
+            buffer: :class:`str` or any object supporting the buffer protocol
+                such as :class:`bytes` or :class:`bytearray`.
+            encoding (str): Encoding used to decode binary buffers. Defaults
+                to 'utf-8'.
+        """
+        if not isinstance(buffer, str):
+            buffer= str(buffer, encoding)
+
+        self.startDocument()
+        self.tokenizeBuffer(buffer)
+        self.endDocument()
+
+
+    def parseFile(self, path, encoding="utf-8", chunkSize=65536):
+        """Parse a file
+        
+        The file is read and decoded in chunks, which are tokenized by
+        :meth:`tokenizeChunks`. Memory consumption is thus bounded by the
+        chunk size rather than by the size of the file.
+        
+        Arguments:
+            path (str): Path of file to parse
+            encoding (str): File encoding. Defaults to 'utf-8'.
+            chunkSize (int): Number of bytes read at once. Defaults to 65536.
+        """
+        with open(path, "rb") as f:
+            self.startDocument()
+            self.tokenizeChunks(iter(partial(f.read, chunkSize), b""),
+                                encoding)
+            self.endDocument()
+        
+        
+    async def parseAsync(self, inputStream, encoding="utf-8", yieldEvery=1000):
+        """Parse input from an asynchronous source
+        
+        Chunks are tokenized as they arrive. Chunks need not be aligned with
+        lines. Control is returned to the event loop after every
+        ``yieldEvery`` tokens, so large documents do not block the loop.
+        
+        Arguments:
+            inputStream: Asynchronous iterable of :class:`str` or
+                :class:`bytes` chunks
+            encoding (str): Encoding used to decode binary chunks. Defaults to
+                'utf-8'.
+            yieldEvery (int): Number of tokens processed before control is
+                returned to the event loop. Defaults to 1000.
+        """
+        self.startDocument()
+        await self.tokenizeAsync(inputStream, encoding, yieldEvery)
+        self.endDocument()
+
+
     def startDocument(self):
         """Start parsing a new document/stream
+        
+        Resets the reader via :meth:`reset` and queries the content handler,
+        whether it processes ignorable content and comments. Events the
+        handler does not want are not produced.
         """
-        self._stack.clear()
+        self.reset()
+        self._wantsIgnorable= self._impl.wantsIgnorable
+        self._wantsComments = self._impl.wantsComments
         self._impl.open()
         self._impl.locator= self._locator
         self._impl.enter("root") #Enter root context
         
 
+    def reset(self):
+        """Restore the initial tokenizer state
+        
+        Discards all state left over from a previous, possibly incomplete
+        document, such that the reader can be reused, and resets the error
+        counters :attr:`nErrors` and :attr:`nWarnings`. Called by
+        :meth:`startDocument`.
+        """
+        self.nErrors          = 0
+        self.nWarnings        = 0
+        self._onLhs           = True
+        self._inAttributes    = False
+        self._inBlock         = False
+        self._currentAttribute= None
+        self._buffer.clear()
+        self._attributes.clear()
+        self._stack.clear()
+        self._locator.line    = 0
+        self._locator.column  = 0
+
+
     def endDocument(self):
         """End parsing the current document
         """
@@ -111,39 +456,174 @@ class DefaultReader(ErrorHandler):
         Arguments:
             inputStream: Input stream
         """
-
         for self._locator.line, line in enumerate(inputStream, start=1):
-            self._locator.column= 0
-            end= len(line)
-
-            while self._locator.column != end:
-                match= None
-                for regex, action in self._actions:
-                    match= regex.match(line[self._locator.column:])
-                    if match:
-                        try:
-                            action(match)
-                        except Exception as ex:
-                            self._impl.fatalError( str(ex) )
-
-                        self._locator.column+= match.end()
-                        break
-                
-                if not match:
-                    self.error("Undefined pattern")
+            self._scan(line, 0, len(line))
+
+
+    def tokenizeBuffer(self, buffer):
+        """Tokenize an entire document and process tokens
+        
+        Equivalent to :meth:`tokenize` applied to ``buffer.splitlines(True)``
+        with lines separated by ``'\\n'``, but without creating a string for
+        each line.
+        
+        Arguments:
+            buffer (str): Document content
+        """
+        end= len(buffer)
+        begin= 0
+        self._locator.line= 0
+
+        while begin != end:
+            stop= buffer.find("\n", begin) + 1 or end
+            self._locator.line+= 1
+            self._scan(buffer, begin, stop)
+            begin= stop
+
+
+    def tokenizeChunks(self, chunks, encoding="utf-8"):
+        """Tokenize input arriving in chunks and process tokens
+        
+        Chunks need not be aligned with lines or characters. All complete
+        lines of a chunk are tokenized in place like in :meth:`tokenizeBuffer`,
+        only an incomplete last line is carried over to the next chunk.
+        
+        Arguments:
+            chunks: Iterable of :class:`str` or :class:`bytes` chunks
+            encoding (str): Encoding used to decode binary chunks. Defaults to
+                'utf-8'.
+        """
+        decoder= codecs.getincrementaldecoder(encoding)()
+        parts  = list() #incomplete last line of previous chunks
+        locator= self._locator
+        scan   = self._scan
+        lines  = completeLines
+        locator.line= 0
+
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                chunk= decoder.decode(chunk)
+
+            buffer, end= lines(parts, chunk)
+            begin= 0
+
+            while begin != end:
+                stop= buffer.find("\n", begin) + 1
+                locator.line+= 1
+                scan(buffer, begin, stop)
+                begin= stop
+
+        parts.append(decoder.decode(b"", final=True))
+        pending= "".join(parts)
+
+        if pending:
+            locator.line+= 1
+            scan(pending, 0, len(pending))
+
+
+    async def tokenizeAsync(self, inputStream, encoding="utf-8",
+                            yieldEvery=1000):
+        """Tokenize input from an asynchronous source and process tokens
+        
+        Arguments:
+            inputStream: Asynchronous iterable of :class:`str` or
+                :class:`bytes` chunks
+            encoding (str): Encoding used to decode binary chunks
+            yieldEvery (int): Number of tokens processed before control is
+                returned to the event loop.
+        """
+        decoder= None
+        parts  = list() #incomplete last line of previous chunks
+        tokens = 0
+        self._locator.line= 0
+
+        async for chunk in inputStream:
+            if not isinstance(chunk, str):
+                if decoder is None:
+                    decoder= codecs.getincrementaldecoder(encoding)()
+                chunk= decoder.decode(chunk)
+
+            buffer, end= completeLines(parts, chunk)
+            begin= 0
+
+            while begin != end:
+                stop= buffer.find("\n", begin) + 1
+                self._locator.line+= 1
+                tokens+= self._scan(buffer, begin, stop)
+                begin= stop
+
+                if tokens >= yieldEvery:
+                    tokens= 0
+                    await asyncio.sleep(0)
+
+        if decoder is not None:
+            parts.append(decoder.decode(b"", final=True))
+        pending= "".join(parts)
+
+        if pending:
+            self._locator.line+= 1
+            self._scan(pending, 0, len(pending))
+
+
+    def _scan(self, string, begin, end):
+        """Tokenize a single line and process tokens
+        
+        Patterns are matched in place and never see characters beyond
+        ``end``, so the line need not be sliced from the input string.
+        
+        Arguments:
+            string (str): String containing the line
+            begin (int): Index of first character of line in ``string``
+            end (int): Index past the last character of line in ``string``
+            
+        Return:
+            int: Number of tokens processed
+        """
+        scanner = self.scanner()
+        dispatch= self._dispatch
+        locator = self._locator
+        pos     = begin
+        tokens  = 0
+        
+        while pos != end:
+            locator.column= pos - begin
+            match= scanner.match(string, pos, end)
+
+            if not match:
+                self.error("Undefined pattern")
+                break #skip remainder of line
+
+            # The outermost group of the winning pattern closes last
+            offset= match.lastindex
+
+            try:
+                dispatch[offset](match, offset)
+            except SchemaError:
+                raise
+            except Exception as ex:
+                raise SchemaError(str(ex), locator) from ex
+
+            pos= match.end()
+            tokens+= 1
+
+        locator.column= end - begin
+        return tokens
             
 
-    def comment(self, match):
+    def comment(self, match, offset=0):
         """Parse a comment string
         
         Arguments:
             match (:class:`re.MatchObject`): Regular expression match object
+            offset (int): Group offset of pattern in ``match``
         """
         self._endAssignment()
-        self._impl.comment(match.group(1))
 
+        if self._wantsComments:
+            self._impl.comment(match.group(offset + 1))
 
-    def beginBlock(self, match):
+
+    def beginBlock(self, match, offset=0):
         if self._inBlock:
             raise ValueError("Nested blocks are not allowed")
         
@@ -153,11 +633,11 @@ class DefaultReader(ErrorHandler):
         if self._onLhs:
             raise ValueError("Blocks are not allowed on RHS expressions")
         
-        self._impl.content(match.group(0))
+        self._impl.content(match.group(offset))
         self._inBlock= True
 
 
-    def endBlock(self, match):
+    def endBlock(self, match, offset=0):
         if not self._inBlock:
             raise ValueError("Spourious ')'")
         
@@ -165,44 +645,47 @@ class DefaultReader(ErrorHandler):
         self._inBlock= False
 
 
-    def quoted_identifier(self, match):
+    def quoted_identifier(self, match, offset=0):
         if self._inBlock:
             self._impl.content("\"")
         
-        self.identifier(match)
+        self.identifier(match, offset)
         
         if self._inBlock:
             self._impl.content("\"")
 
 
-    def identifier(self, match):
+    def identifier(self, match, offset=0):
         if self._inAttributes:
             if self._onLhs:
                 if self._currentAttribute is not None:
                     raise ValueError("Expected assignment")
                     
-                self._currentAttribute= match.group(2)
+                self._currentAttribute= match.group(offset + 2)
             else:
-                self._attributes[self._currentAttribute]= match.group(2)
+                self._attributes[self._currentAttribute]= \
+                    match.group(offset + 2)
                 self._endAssignment()
         else:
             # Not in attribute mode
-            self._impl.ignore( match.group(1) )
+            if self._wantsIgnorable:
+                self._impl.ignore( match.group(offset + 1) )
             if self._onLhs:
-                self._buffer.add( match.group(2) )
+                self._buffer.add( match.group(offset + 2) )
             else:
-                self._impl.content( match.group(2) )
+                self._impl.content( match.group(offset + 2) )
         
 
-    def beginAssignment(self, match):
+    def beginAssignment(self, match, offset=0):
         """Called if an assignment character is found
         
         Arguments:
             match: Ignored match object.
+            offset: Ignored group offset.
         """
         if self._inBlock:
             # Inside a block assignment chars are ignored.
-            self._impl.content(match.group(0))
+            self._impl.content(match.group(offset))
             return
             
         if not self._onLhs:
@@ -215,25 +698,27 @@ class DefaultReader(ErrorHandler):
         self._onLhs= False
 
 
-    def comma(self, match):
+    def comma(self, match, offset=0):
         """Called if a comma is found
         
         Arguments:
             match (:class:'MatchObject'): match object
+            offset (int): Group offset of pattern in ``match``
         """
         if self._inBlock:
-            self._impl.content(match.group(1))
+            self._impl.content(match.group(offset + 1))
         elif self._inAttributes:
             self._endAssignment()
         else:
-            self._impl.content(match.group(1))
+            self._impl.content(match.group(offset + 1))
         
 
-    def semicolon(self, match):
+    def semicolon(self, match, offset=0):
         """Called if a semicolon is found
         
         Arguments:
             match (:class:'MatchObject'): match object
+            offset (int): Group offset of pattern in ``match``
         """
         self._endAssignment()
         
@@ -261,7 +746,7 @@ class DefaultReader(ErrorHandler):
         self._onLhs= True
 
 
-    def enterContext(self, match=None):
+    def enterContext(self, match=None, offset=0):
         """Enter a new context
         
         Called if either an opening curly bracket or an assignment character
@@ -269,6 +754,7 @@ class DefaultReader(ErrorHandler):
         
         Arguments:
             match: Ignored match object.
+            offset: Ignored group offset.
         """
         if self._inBlock:
             raise ValueError("Cannot start context in block")
@@ -292,7 +778,7 @@ class DefaultReader(ErrorHandler):
             self._attributes.clear()
 
 
-    def leaveContext(self, match=None):
+    def leaveContext(self, match=None, offset=0):
         """Called if a closing curly bracket is encountered
         """
         if self._inBlock:
@@ -307,14 +793,16 @@ class DefaultReader(ErrorHandler):
         self._impl.leave()
 
 
-    def newline(self, match):
+    def newline(self, match, offset=0):
         """Invoked each time a line is complete
 
         Arguments:
             match (): Match object        
+            offset (int): Group offset of pattern in ``match``
         """
         if self._inBlock:
-            self._impl.ignore(match.group(0))
+            if self._wantsIgnorable:
+                self._impl.ignore(match.group(offset))
             return
             
         self._endAssignment()
@@ -331,13 +819,13 @@ class DefaultReader(ErrorHandler):
     
             # If buffer is not empty, we are facing content without assignment            
             self._impl.content( self._buffer.flush() )
-            self._impl.content(match.group(0))                
+            self._impl.content(match.group(offset))                
 
 
-    def beginAttributes(self, match):
+    def beginAttributes(self, match, offset=0):
         if not self._onLhs:
             # An RHS '[' is treated as content
-            self._impl.content( match.group(0) )
+            self._impl.content( match.group(offset) )
             return
             
         if self._inBlock:
@@ -349,7 +837,7 @@ class DefaultReader(ErrorHandler):
         self._inAttributes= True
 
 
-    def endAttributes(self, match=None):
+    def endAttributes(self, match=None, offset=0):
         if self._inBlock:
             raise ValueError("']' not allowed in block")
 
@@ -362,17 +850,18 @@ class DefaultReader(ErrorHandler):
         self._inAttributes= False
         
         
-    def ignore(self, match):
+    def ignore(self, match, offset=0):
         """Ignore matched content
         
         Forwards the entire content to :meth:`~.ContextManager.ignoreContent`        
         
         Arguments:
             match (:class:re.MatchObject): Match object.
+            offset (int): Group offset of pattern in ``match``
         """
-        if self._inBlock:
+        if self._inBlock or not self._wantsIgnorable:
             return
             
         if not self._inAttributes:
-            self._impl.ignore( match.group(0) )
+            self._impl.ignore( match.group(offset) )
       
\ No newline at end of file
@@ -7,41 +7,69 @@ from .writer_base import WriterBase
 class DefaultWriter(WriterBase):
     """Default writer for ASCII files
     
-    Fulfills the Dispatcher interface.
+    Fulfills the Dispatcher interface. Output is collected in an internal
+    buffer and written to the output stream in large chunks. The buffer is
+    flushed when it exceeds ``bufferSize`` strings, at the end of the
+    document and when :meth:`close` or :meth:`flush` is called.
 
     Arguments:
         os: Output stream    
+        assignChar (str): Assignment character. Defaults to '='.
+        commentChar (str): Comment character. Defaults to '#'.
+        bufferSize (int): Number of strings buffered before the buffer is
+            written to the output stream. Defaults to 4096.
     """
-    def __init__(self, os=stdout, assignChar= "=", commentChar= "#" ):
+    def __init__(self, os=stdout, assignChar= "=", commentChar= "#",
+                 bufferSize=4096):
         super().__init__()
         self.indent        = 2
+        self.bufferSize    = bufferSize
         self._os           = os
         self._assignChar   = assignChar
         self._commentChar  = commentChar
-        self._currentIndent= ""
+        self._assign       = "{0} ".format(assignChar)
+        self._out          = list() #: Buffered output strings
+        self._depth        = 0
 
 
     def open(self):
         """Start new document
         """
         super().open()
-        self._currentIndent= ""
+        self.flush()
+        self._depth= 0
+
+
+    def close(self):
+        """End current document and flush buffered output
+        """
+        super().close()
+        self.flush()
+
+
+    def flush(self):
+        """Write buffered output to output stream
+        """
+        if self._out:
+            self._os.write("".join(self._out))
+            self._out.clear()
 
     
-    def enterLeaf(self, name, attrs=None):
+    def enterLeaf(self, name, **kwargs):
         """Enter leaf node
         
         Arguments:
             name (:class:`str`): Name of node
-            attrs (:class:`dict`): Optional attributes
+            **kwargs: Optional attributes
         """
-        self._indent()
-        self._os.write(name)
+        out= self._out
+        out.append(self.indentation(self._depth))
+        out.append(name)
 
-        if attrs:
-            self._os.write("[{0}]".format(", ".join(self._iterAttrs(attrs)) ))
+        if kwargs:
+            out.append("[{0}]".format(", ".join(self._iterAttrs(kwargs)) ))
 
-        self._os.write("{0} ".format(self._assignChar) )
+        out.append(self._assign)
         
                    
     def enterBranch(self, name, **kwargs):
@@ -51,28 +79,37 @@ class DefaultWriter(WriterBase):
             name (:class:`str`): Name of node
             **kwargs: Optional keyword arguments
         """
-        self._indent()
-        self._os.write(name)
+        out= self._out
+        out.append(self.indentation(self._depth))
+        out.append(name)
 
         if kwargs:
-            self._os.write("[{0}]".format(", ".join(self._iterAttrs(kwargs)) ))
+            out.append("[{0}]".format(", ".join(self._iterAttrs(kwargs)) ))
 
-        self._os.write(" {\n")
-        self._currentIndent= "".join([self._currentIndent, self.indent * " "])
+        out.append(" {\n")
+        self._depth+= 1
         
         
     def exitLeaf(self):
         """Exit current leaf node
         """
-        self._os.write("\n")
+        out= self._out
+        out.append("\n")
+
+        if len(out) >= self.bufferSize:
+            self.flush()
 
         
     def exitBranch(self):
         """Exit current branch node
         """
-        self._currentIndent= self._currentIndent[:-self.indent]
-        self._indent()
-        self._os.write("}\n")
+        self._depth-= 1
+        out= self._out
+        out.append(self.indentation(self._depth))
+        out.append("}\n")
+
+        if len(out) >= self.bufferSize or not self._depth:
+            self.flush()
 
 
     def writeContent(self, content):
@@ -81,10 +118,10 @@ class DefaultWriter(WriterBase):
         Arguments:
             content(:class:`str`): String containing content
         """
-        if not content or content.startswith(" ") or content.endswith(" "):
-            self._os.write( "\"{0}\"".format(content) )
+        if not content or content[0] == " " or content[-1] == " ":
+            self._out.append("".join(("\"", content, "\"")))
         else:
-            self._os.write(content)
+            self._out.append(content)
         
        
     def writeComment(self, comment):
@@ -93,9 +130,12 @@ class DefaultWriter(WriterBase):
         Arguments:
             comment(:class:`str`): String containing comment
         """
-        for line in self.split(comment, maxLen= 80 - len(self._currentIndent)):
-            self._indent()
-            self._os.write("{0}{1}\n".format(self._commentChar, line))
+        indent= self.indentation(self._depth)
+        out= self._out
+
+        for line in self.split(comment, maxLen= 80 - len(indent)):
+            out.append(indent)
+            out.append("{0}{1}\n".format(self._commentChar, line))
 
 
     def _iterAttrs(self, attrs):
@@ -106,9 +146,3 @@ class DefaultWriter(WriterBase):
         """
         for key, value in sorted(attrs.items()):
             yield "{0}=\"{1}\"".format(key, value)
-
-            
-    def _indent(self):
-        """Print indentation level
-        """
-        self._os.write( self._currentIndent )
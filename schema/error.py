@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from types import SimpleNamespace
 
 class SchemaError(Exception):
     """Exception for this library.
@@ -17,6 +18,14 @@ class SchemaError(Exception):
         super().__init__(message, line, col)
 
 
+    def __reduce__(self):
+        """Support pickling, e.g. to pass errors between processes
+        """
+        return (type(self),
+                (self.message, SimpleNamespace(line=self.line,
+                                               column=self.column)))
+
+
     @property
     def message(self):
         return self.args[0]
@@ -5,7 +5,7 @@ import logging
                 
 #Level dependent log formats
 DEFAULT_FORMAT= "%(locator)s: %(message)s\n"
-ERROR_FORMAT  = "%(levelname)s (%(locator)): %(message)s\n"
+ERROR_FORMAT  = "%(levelname)s (%(locator)s): %(message)s\n"
 
 LOG_FORMATS= { logging.WARNING : ERROR_FORMAT,
                logging.ERROR   : ERROR_FORMAT}
@@ -196,24 +196,28 @@ class ErrorHandler(object):
     def _setLocator(self, d=dict()):
         """Set locator attribute in dictionary
         
-        Extracts a Locator object from the input dictionary and replaces it
-        by a string representing the locator. If no 'locator' keyword argument
-        exists, locator is attempted to be retrieved from self.locator (which
-        has to be implemented by the parent)
+        Extracts a Locator object from the input dictionary and moves a
+        string representing the locator into the 'extra' dictionary passed to
+        the logger. If no 'locator' keyword argument exists, locator is
+        attempted to be retrieved from self.locator (which has to be
+        implemented by the parent)
         
         
         Arguments:
             d (dict): Input dictionary
             
         Return:
-            dict: Input dictionary with 'locator' key set to an appropriate
-            string
+            dict: Input dictionary with key 'locator' of d['extra'] set to an
+            appropriate string
         """
-        loc= d.get("locator", getattr(self, "locator", None))
-        if loc is None:
-            d["locator"]= "?:?"
-        else:
-            d["locator"]= str(loc)
+        extra= d.setdefault("extra", dict())
+
+        if "locator" in d or "locator" not in extra:
+            loc= d.pop("locator", getattr(self, "locator", None))
+            if loc is None:
+                extra["locator"]= "?:?"
+            else:
+                extra["locator"]= str(loc)
 
         return d
         
\ No newline at end of file
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+from .content_handler import ContentHandler, ENTER, LEAVE, CONTENT, COMMENT, \
+                             IGNORE
+
+
+class EventBatch(ContentHandler):
+    """Collects events and forwards them to a content handler in batches
+    
+    EventBatch implements the :class:`~schema.ContentHandler` interface and
+    stores all events it receives as compact ``(opcode, payload)`` tuples.
+    Pending events are passed to :meth:`~schema.ContentHandler.events` of the
+    destination handler, whenever a context is left with at least ``size``
+    events pending, and when the document is closed. Empty content, comments
+    and ignorable strings are dropped.
+    
+    Note that events are processed by the destination with a delay, so the
+    locator reports the position at which the batch was flushed rather than
+    the position of the individual event.
+    
+    Arguments:
+        contentHandler (:class:`~schema.ContentHandler`): Destination handler
+        size (int): Minimum number of events per batch. Defaults to 1024.
+    """
+    def __init__(self, contentHandler, size=1024):
+        self._impl  = contentHandler
+        self._events= list()
+        self.size   = size
+
+
+    @property
+    def locator(self):
+        """Return the locator of the destination handler
+        
+        Return:
+            :class:`~schema.Locator`: Locator object
+        """
+        return self._impl.locator
+
+
+    @locator.setter
+    def locator(self, locator):
+        """Set locator used by the destination handler
+        
+        Arguments:
+            locator(`schema.Locator`): Locator object.
+        """
+        self._impl.locator= locator
+
+
+    @property
+    def wantsIgnorable(self):
+        """Whether the destination handler processes ignorable content
+        """
+        return self._impl.wantsIgnorable
+
+
+    @property
+    def wantsComments(self):
+        """Whether the destination handler processes comments
+        """
+        return self._impl.wantsComments
+
+
+    def open(self):
+        """Discard pending events and open destination
+        """
+        self._events.clear()
+        self._impl.open()
+
+
+    def close(self):
+        """Flush pending events and close destination
+        """
+        self.flush()
+        self._impl.close()
+
+
+    def enter(self, name, **kwargs):
+        """Add enter event to batch
+        
+        Arguments:
+            name (str): Name of context to enter
+            **kwargs: Attributes
+        """
+        self._events.append( (ENTER, (name, kwargs)) )
+
+
+    def leave(self):
+        """Add leave event to batch and flush batch if it is full
+        """
+        self._events.append( (LEAVE, None) )
+
+        if len(self._events) >= self.size:
+            self.flush()
+
+
+    def content(self, content):
+        """Add content event to batch
+
+        Arguments:
+            content(str): String containing content
+        """
+        if content:
+            self._events.append( (CONTENT, content) )
+
+
+    def comment(self, comment):
+        """Add comment event to batch
+
+        Arguments:
+            comment(str): String containing comment
+        """
+        if comment:
+            self._events.append( (COMMENT, comment) )
+
+
+    def ignore(self, content):
+        """Add ignorable content event to batch
+
+        Arguments:
+            content(str): String containing ignorable content
+        """
+        if content:
+            self._events.append( (IGNORE, content) )
+
+
+    def flush(self):
+        """Pass all pending events to the destination handler
+        """
+        if self._events:
+            try:
+                self._impl.events(self._events)
+            finally:
+                self._events.clear()
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+import os
+import pickle
+import hashlib
+
+from .content_handler import ContentHandler, ENTER, LEAVE, CONTENT, COMMENT, \
+                             IGNORE
+from .default_reader import DefaultReader, Locator
+
+#Version of the cache file format. Increase on incompatible changes.
+FORMAT_VERSION= 2
+
+
+class EventRecorder(ContentHandler):
+    """Content handler recording events and forwarding them to a destination
+    
+    Each event is stored in :attr:`recorded` as tuple
+    ``(opcode, payload, line, column)`` along with the locator position at
+    which it was received. Opcodes are those of
+    :meth:`~schema.ContentHandler.events`. Batches of events are recorded
+    at the locator position at which they are received and forwarded as a
+    batch.
+    
+    Arguments:
+        contentHandler (:class:`~schema.ContentHandler`): Destination handler.
+            ``None`` if events shall only be recorded.
+    """
+    def __init__(self, contentHandler=None):
+        self.recorded= list() #: Recorded events
+        self._impl   = contentHandler or ContentHandler()
+        self._locator= None
+
+
+    @property
+    def locator(self):
+        """Return the currently used locator
+        
+        Return:
+            :class:`~schema.Locator`: Locator object
+        """
+        return self._locator
+
+
+    @locator.setter
+    def locator(self, locator):
+        """Set locator used by this handler and the destination
+        
+        Arguments:
+            locator(`schema.Locator`): Locator object.
+        """
+        self._locator= locator
+        self._impl.locator= locator
+
+
+    def open(self):
+        """Discard recorded events and open destination
+        """
+        self.recorded.clear()
+        self._impl.open()
+
+
+    def close(self):
+        """Close destination
+        """
+        self._impl.close()
+
+
+    def enter(self, name, **kwargs):
+        """Record and forward enter event
+        
+        Arguments:
+            name (str): Name of context to enter
+            **kwargs: Attributes
+        """
+        self._record(ENTER, (name, kwargs))
+        self._impl.enter(name, **kwargs)
+
+
+    def leave(self):
+        """Record and forward leave event
+        """
+        self._record(LEAVE, None)
+        self._impl.leave()
+
+
+    def content(self, content):
+        """Record and forward content
+
+        Arguments:
+            content(str): String containing content
+        """
+        self._record(CONTENT, content)
+        self._impl.content(content)
+
+
+    def comment(self, comment):
+        """Record and forward comment
+
+        Arguments:
+            comment(str): String containing comment
+        """
+        self._record(COMMENT, comment)
+        self._impl.comment(comment)
+
+
+    def ignore(self, content):
+        """Record and forward ignorable content
+
+        Arguments:
+            content(str): String containing ignorable content
+        """
+        self._record(IGNORE, content)
+        self._impl.ignore(content)
+
+
+    def events(self, batch):
+        """Record and forward a batch of events
+
+        Arguments:
+            batch (list): List of ``(opcode, payload)`` tuples
+        """
+        if self._locator is None:
+            line, column= 0, 0
+        else:
+            line, column= self._locator.line, self._locator.column
+
+        self.recorded.extend( (opcode, payload, line, column)
+                              for opcode, payload in batch )
+        self._impl.events(batch)
+
+
+    def _record(self, opcode, payload):
+        """Append event at current locator position to recorded events"""
+        if self._locator is None:
+            self.recorded.append( (opcode, payload, 0, 0) )
+        else:
+            self.recorded.append( (opcode, payload, self._locator.line,
+                                   self._locator.column) )
+
+
+def replay(events, contentHandler):
+    """Replay recorded events into a content handler
+    
+    The handler is opened and closed and receives a locator reporting the
+    recorded position of each event.
+    
+    Arguments:
+        events (iterable): Tuples ``(opcode, payload, line, column)`` as
+            recorded by :class:`EventRecorder`.
+        contentHandler (:class:`~schema.ContentHandler`): Destination handler
+    """
+    locator= Locator()
+    contentHandler.open()
+    contentHandler.locator= locator
+
+    skip= set()
+    if not contentHandler.wantsIgnorable:
+        skip.add(IGNORE)
+    if not contentHandler.wantsComments:
+        skip.add(COMMENT)
+    
+    for opcode, payload, locator.line, locator.column in events:
+        if opcode == CONTENT:
+            contentHandler.content(payload)
+        elif opcode == ENTER:
+            name, attrs= payload
+            contentHandler.enter(name, **attrs)
+        elif opcode == LEAVE:
+            contentHandler.leave()
+        elif opcode in skip:
+            continue
+        elif opcode == IGNORE:
+            contentHandler.ignore(payload)
+        elif opcode == COMMENT:
+            contentHandler.comment(payload)
+
+    contentHandler.close()
+
+
+class EventCache(object):
+    """On-disk cache of the event streams produced by reading files
+    
+    The first time a file is parsed through the cache, the events produced by
+    the reader are recorded along with their locator positions and stored in
+    a binary file in the cache directory. As long as path, modification time
+    and size of the source file are unchanged, subsequent calls replay the
+    stored events into the content handler without reading the file. If only
+    the modification time or size changed, the file is hashed and the stored
+    events are still used, if its content is unchanged.
+    
+    Arguments:
+        directory (str): Cache directory. Created if it does not exist.
+        reader (type): Reader class, e.g. :class:`~schema.DefaultReader` or
+            :class:`~schema.IniReader`. The class must provide
+            ``parseBuffer``.
+        **kwargs: Keyword arguments passed to the reader constructor such
+            as ``assignChar`` or ``commentChar``.
+    """
+    def __init__(self, directory, reader=DefaultReader, **kwargs):
+        self.directory= directory
+        self._reader  = reader
+        self._kwargs  = kwargs
+        os.makedirs(directory, exist_ok=True)
+
+
+    def cacheFile(self, path):
+        """Get path of cache file for a source file
+        
+        The name is derived from the absolute source path, the reader class
+        and the reader arguments.
+        
+        Arguments:
+            path (str): Path of source file
+            
+        Return:
+            str: Path of cache file
+        """
+        key= repr( (os.path.abspath(path), self._reader.__module__,
+                    self._reader.__qualname__, sorted(self._kwargs.items())) )
+        name= hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + ".events")
+
+
+    def parseFile(self, path, contentHandler, encoding="utf-8"):
+        """Parse file or replay its cached events
+        
+        Arguments:
+            path (str): Path of file to parse
+            contentHandler (:class:`~schema.ContentHandler`): Destination
+                handler
+            encoding (str): File encoding. Defaults to 'utf-8'.
+            
+        Return:
+            bool: ``True`` if and only if cached events were replayed
+        """
+        stat= os.stat(path)
+        cacheFile= self.cacheFile(path)
+        header= self._header(cacheFile)
+
+        if header is not None and \
+           header[:2] == (stat.st_mtime_ns, stat.st_size):
+            events= self._events(cacheFile)
+            if events is not None:
+                replay(events, contentHandler)
+                return True
+        
+        with open(path, "rb") as f:
+            data= f.read()
+
+        digest= hashlib.sha256(data).hexdigest()
+
+        if header is not None and header[2] == digest:
+            events= self._events(cacheFile)
+            if events is not None:
+                self._store(cacheFile, stat, digest, events)
+                replay(events, contentHandler)
+                return True
+
+        recorder= EventRecorder(contentHandler)
+        self._reader(recorder, **self._kwargs).parseBuffer(data,
+                                                           encoding=encoding)
+        self._store(cacheFile, stat, digest, recorder.recorded)
+        return False
+
+
+    def _header(self, cacheFile):
+        """Load header of cache file
+        
+        Return:
+            tuple: Modification time, size and hash of the source file or
+            ``None`` if no valid entry exists
+        """
+        try:
+            with open(cacheFile, "rb") as f:
+                header= pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        if header[0] != FORMAT_VERSION:
+            return None
+        return header[1:]
+
+
+    def _events(self, cacheFile):
+        """Load events of cache file
+        
+        Return:
+            list: Recorded events or ``None`` if the file cannot be read
+        """
+        try:
+            with open(cacheFile, "rb") as f:
+                pickle.load(f) #header
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+
+    def _store(self, cacheFile, stat, digest, events):
+        """Store events atomically in cache file"""
+        tmpFile= "{0}.{1:d}.tmp".format(cacheFile, os.getpid())
+
+        with open(tmpFile, "wb") as f:
+            pickle.dump( (FORMAT_VERSION, stat.st_mtime_ns, stat.st_size,
+                          digest), f, protocol=pickle.HIGHEST_PROTOCOL )
+            pickle.dump( events, f, protocol=pickle.HIGHEST_PROTOCOL )
+
+        os.replace(tmpFile, cacheFile)
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+from .context import Context
+from .error import SchemaError
+from .mixins.proxy import Proxy
+from .validator import Validator
+
+
+def _component(name, attrs):
+    """Get path component of a context entered with attributes
+
+    Arguments:
+        name (str): Context name
+        attrs (dict): Attributes passed to the context
+
+    Return:
+        object: ``name`` if no attributes are passed, otherwise a tuple of
+        name and sorted attribute items
+    """
+    if attrs:
+        return name, tuple(sorted(attrs.items()))
+    return name
+
+
+def _split(component):
+    """Split path component into name and attribute dictionary
+
+    Arguments:
+        component (object): Path component created by :func:`_component`
+
+    Return:
+        tuple: ``(name, attrs)``
+    """
+    if isinstance(component, tuple):
+        return component[0], dict(component[1])
+    return component, dict()
+
+
+def _pathString(path):
+    """Convert path to string for error messages"""
+    return "/".join(_split(component)[0] for component in path)
+
+
+def _target(context):
+    """Get context receiving the content of a context
+
+    Arguments:
+        context (:class:`~schema.Context`): Active context
+
+    Return:
+        :class:`~schema.Context`: Current delegate for proxies, ``context``
+        otherwise
+    """
+    while isinstance(context, Proxy):
+        context= context.delegate
+    return context
+
+
+class IncrementalValidator(Validator):
+    """Validator updating only changed contexts when re-reading input
+
+    The first document is validated like with :class:`~schema.Validator`.
+    Content of each document is recorded by context path. Subsequent
+    documents are only recorded while they are read. When the document is
+    closed, the recorded content is compared with the previous document and
+
+    * contexts, which disappeared from the input, are reset,
+    * contexts with changed content are reset (leaf contexts only) and
+      assigned the new content.
+
+    Unchanged contexts are not touched. This is intended for reloading
+    large input, where only small parts change between reloads.
+
+    Errors in the structure of a subsequent document (e.g. unknown context
+    names) are only detected when the document is closed. If the update
+    fails, the next document is validated in full.
+
+    Arguments:
+        schema (:class:~schema.Schema or :class:`~schema.Context`): Input
+            schema against which to validate.
+        profiler (:class:`~schema.Profiler`): Passed to
+            :class:`~schema.Validator`
+        compiled (bool): If ``True``, the schema is compiled (see
+            :meth:`~schema.Schema.compile`). Events are always recorded by
+            this class, so the compiled event handling of
+            :class:`~schema.Validator` is not used. Defaults to ``False``.
+    """
+    def __init__(self, schema, profiler=None, compiled=False):
+        #compiled event handlers of Validator would bypass recording
+        super().__init__(schema, profiler=profiler)
+
+        if compiled:
+            self._schema= self._schema.compile()
+
+        self._previous= None #document recorded by last successful run
+        self._base= None #document compared to during the current run
+        self._document= dict()
+        self._stack= list()
+        self._current= list()
+
+
+    @property
+    def incremental(self):
+        """Check whether the next document is validated incrementally
+
+        Return:
+            bool: ``True`` if and only if a previous document is available
+        """
+        return self._previous is not None
+
+
+    def clear(self):
+        """Discard previous document, so the next document is read in full
+        """
+        self._previous= None
+
+
+    def open(self):
+        """Start recording a new document
+
+        Resets the schema if no previous document is available.
+        """
+        self._base, self._previous= self._previous, None
+        self._document= dict()
+        self._stack.clear()
+        self._buffer.clear()
+
+        if self._base is None:
+            super().open()
+
+
+    def close(self):
+        """Finish document and update schema, if reading incrementally
+        """
+        document= self._document
+
+        if self._base is None:
+            super().close()
+        else:
+            self._update(self._base, document)
+            self._base= None
+
+        self._previous= document
+
+
+    def enter(self, name, **kwargs):
+        """Enter a sub context and record it
+
+        Arguments:
+            name (str): Name of context to enter
+            **kwargs: Keyword arguments passed verbatim to schema
+
+        Raises:
+            :class:`~schema.SchemaError`: If entering context fails
+        """
+        stack= self._stack
+
+        if stack:
+            parent, segments= stack[-1]
+            segments.append(self._buffer.getContent())
+            path= parent + (_component(name, kwargs),)
+        else:
+            path= (_component(name, kwargs),)
+
+        stack.append((path, []))
+        self._document.setdefault(path, [])
+
+        if self._base is None:
+            super().enter(name, **kwargs)
+        else:
+            self._buffer.clear()
+
+
+    def leave(self):
+        """Record content of the current context and leave it
+        """
+        path, segments= self._stack.pop()
+        segments.append(self._buffer.getContent())
+        self._document[path].append(tuple(segments))
+
+        if self._base is None:
+            super().leave()
+        else:
+            self._buffer.clear()
+
+
+    def _update(self, old, new):
+        """Apply differences between two documents to the schema
+
+        Arguments:
+            old (dict): Previous document
+            new (dict): Current document
+
+        Raises:
+            :class:`~schema.SchemaError`: If a context cannot be updated
+        """
+        schema= self._schema
+        schema.reset()
+        self._current.clear()
+        path= ()
+
+        try:
+            for path in old:
+                #reset topmost disappeared contexts only
+                if path not in new and (len(path) == 1 or path[:-1] in new):
+                    self._moveTo(path)
+                    _target(schema.activeContext).reset()
+
+            for path, occurrences in new.items():
+                if old.get(path) == occurrences:
+                    continue
+
+                self._moveTo(path[:-1])
+                name, attrs= _split(path[-1])
+                for i, segments in enumerate(occurrences):
+                    schema.enter(name, resetChildren=False, **attrs)
+                    target= _target(schema.activeContext)
+                    #leaf contexts may accumulate content, e.g. lists
+                    if i == 0 and type(target).getChild is Context.getChild:
+                        target.reset()
+                    for segment in segments:
+                        schema.content(segment)
+                    schema.leave()
+
+            schema.close()
+        except Exception as ex:
+            raise SchemaError("In '{}': {}".format(_pathString(path), ex),
+                              self.locator) from ex
+
+
+    def _moveTo(self, path):
+        """Make context at path the active context
+
+        Only contexts differing from the currently entered path are left and
+        entered. Children are not reset, when a context is entered.
+
+        Arguments:
+            path (tuple): Path of context to move to
+        """
+        schema= self._schema
+        current= self._current
+        common= 0
+
+        for a, b in zip(current, path):
+            if a != b:
+                break
+            common+= 1
+
+        while len(current) > common:
+            schema.leave()
+            current.pop()
+
+        for component in path[common:]:
+            name, attrs= _split(component)
+            schema.enter(name, resetChildren=False, **attrs)
+            current.append(component)
@@ -6,16 +6,33 @@ class IniReader(DefaultReader):
     
     Arguments:
         contentHandler (:class:`~.ContentHandler`): Content handler.   
+        assignChar (:class:`str`): Assignment character. Defaults to '='.
+        commentChar (:class:`str`): Comment character. Defaults to ';'.
+        batchSize (int): Event batch size. Refer to
+           :class:`~schema.DefaultReader` for details.
     """
-    def __init__(self, contentHandler, assignChar='=', commentChar=';'):
+    def __init__(self, contentHandler, assignChar='=', commentChar=';',
+                 batchSize=0):
         super().__init__(contentHandler=contentHandler,
                          assignChar=assignChar,
-                         commentChar=commentChar)
+                         commentChar=commentChar,
+                         batchSize=batchSize)
 
-        self._actions.clear()
+        self._inContext= False #: Whether a section is open
+
+
+    @classmethod
+    def defaultActions(cls, assignChar, commentChar):
+        """Get default actions of this reader
         
-        # Default actions
-        self.actions([
+        Arguments:
+            assignChar (:class:`str`): Assignment character
+            commentChar (:class:`str`): Comment character
+            
+        Return:
+            list: List of pairs (pattern, method name) in order of precedence
+        """
+        return [
             (r"{0}([^\n]*)".format(commentChar), "comment"),
             (r"[\t ]*(\r?\n)", "newline"),
             (r"([\t ]*)'([^']*)'", "quoted_identifier"),
@@ -25,40 +42,47 @@ class IniReader(DefaultReader):
             (r"([\ ]*)([^\s{0}{{}}\[\],;{1}\(\)]+)"
               .format(assignChar, commentChar), "identifier"),
             (r"([\t ]+)", "ignore")
-        ])
-       
-        
-    def parse(self, inputStream):
-        """Parse input stream
-        
-        Arguments:
-            inputStream: Stream to parse.
+        ]
+
+
+    def reset(self):
+        """Restore the initial tokenizer state
         """
+        super().reset()
         self._inContext= False
-        self.startDocument()
-        self.tokenize(inputStream)
+
+
+    def endDocument(self):
+        """End parsing the current document
         
+        Leaves the last open section before leaving the root context.
+        """
         if self._inContext:
             self.leaveContext()
         
-        self.endDocument()
+        super().endDocument()
 
 
-    def newContext(self, match):
+    def newContext(self, match, offset=0):
         """Enter a new context
         
         Arguments:
             match: Match object.
+            offset (int): Group offset of pattern in ``match``
         """
         if self._inContext:
             self.leaveContext()
         else:
             self._inContext= True
         
-        self._impl.ignore( match.group(1) )
-        self._impl.ignore( match.group(2) )
-        self._buffer.add( match.group(3) )
+        if self._wantsIgnorable:
+            self._impl.ignore( match.group(offset + 1) )
+            self._impl.ignore( match.group(offset + 2) )
+
+        self._buffer.add( match.group(offset + 3) )
         self.enterContext()
-        self._impl.ignore( match.group(4) )
-        self._impl.ignore( match.group(5) )
+
+        if self._wantsIgnorable:
+            self._impl.ignore( match.group(offset + 4) )
+            self._impl.ignore( match.group(offset + 5) )
        
\ No newline at end of file
@@ -3,15 +3,32 @@ from ..mixin import Mixin
 from ..context import Context
 
 
+#Number of modifications applied to any group. Compared by path indices to
+#detect changes of the tree
+_revision= 0
+
+
+def revision():
+    """Get number of modifications applied to groups so far
+    
+    The revision is incremented whenever children of any group are inserted
+    or replaced. Caches derived from the tree structure compare it with the
+    revision at creation time to detect outdated content.
+    
+    Return:
+        int: Current revision
+    """
+    return _revision
+
+
 class Group(Mixin):
     """Group mixin adds capability to add child contexts to a parent context
     """
     def __init__(self):
-        self._children= list()
-        self._index= dict()
-        #Context cannot be stored as dict, as this would not allow to iterate
-        #over the items in the order in which they were defined. Thus we
-        #use a list in combination with a dictionary for lookup by name
+        self._children= dict()
+        #Children are stored by name. Dictionaries preserve insertion order,
+        #so iteration yields the children in the order in which they were
+        #defined.
 
     def __contains__(self, name):
         """Check if this context contains a subcontext with a given name
@@ -23,7 +40,7 @@ class Group(Mixin):
             bool: ``True`` if and only if ``self`` has a subcontext called
             `name``
         """
-        return name in self._index
+        return name in self._children
 
 
     def __getitem__(self, children):
@@ -35,11 +52,13 @@ class Group(Mixin):
         Return:
             ``self``
         """
+        global _revision
+
         if isinstance(children, Context):
             children= (children, ) #in case there is a single context
         
         self._children.clear()
-        self._index.clear()
+        _revision+= 1
         
         #add elements
         for child in children:
@@ -53,7 +72,7 @@ class Group(Mixin):
     def moveTo(self, other):
         """Move all attributes to other and reset 
         """
-        for child in self._children:
+        for child in self._children.values():
             child.parent= other
 
         super().moveTo(other)
@@ -65,19 +84,19 @@ class Group(Mixin):
         Return:
             Iterator object
         """
-        return iter(self._children)
+        return iter(self._children.values())
 
     def validate(self):
         """Validates all children
         """
-        for child in self._children:
+        for child in self._children.values():
             child.validate()
 
 
     def reset(self):
         """Resets all children
         """
-        for child in self._children:
+        for child in self._children.values():
             child.reset()
 
 
@@ -92,7 +111,7 @@ class Group(Mixin):
         """
         if resetChildren:     
             #do not call self.reset, because it might be overridden
-            for child in self._children:
+            for child in self._children.values():
                 child.reset() 
 
 
@@ -116,10 +135,10 @@ class Group(Mixin):
         Return:
              :class:`schema.Context`: Child context 
         """
-        i= self._index.get(name)
+        child= self._children.get(name)
 
-        if i is not None:
-            return self._children[i]
+        if child is not None:
+            return child
         
         raise ValueError("In Group '{}': No such context : '{}'"
                          .format(self.name, name))
@@ -134,20 +153,16 @@ class Group(Mixin):
         Arguments:
             element (:class:~config.Context): Child element to insert.
         """
+        global _revision
+
         if isinstance(self, Context):
             element.parent= self
         else:
             element.parent= None
             
-        i= self._index.get(element.name)
-        if i is None:
-            # Element with this name does not exist -> append new
-            i= len(self._index)
-            self._index[element.name]= i
-            self._children.append(element)
-        else:
-            #Element with same name exists -> overwrite
-            self._children[i]= element
+        #An existing element with same name is overwritten in place
+        self._children[element.name]= element
+        _revision+= 1
             
             
            
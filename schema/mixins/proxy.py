@@ -82,6 +82,17 @@ class Proxy(Mixin):
         return self
 
 
+    @property
+    def delegate(self):
+        """Get the current delegate
+        
+        Return:
+            :class:`~schema.Context`: Delegate selected by the last call to
+            :meth:`open` or ``None``, if the proxy has not been opened yet.
+        """
+        return self._cur
+
+
     @property    
     def attributes(self):
         """Get dictionary of attributes for this context
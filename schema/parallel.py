@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ProcessPoolExecutor
+
+from .default_reader import DefaultReader
+from .validator import Validator
+from .error import SchemaError
+
+
+def load(path, schemaFactory, reader=DefaultReader):
+    """Load a single file
+    
+    Arguments:
+        path (str): Path of file to load
+        schemaFactory (callable): Callable without arguments returning a
+            tuple ``(context, target)``, where ``context`` is the root
+            :class:`~schema.Context` of a new data model and ``target`` is the
+            object populated by the values of this context.
+        reader (type): Reader class providing ``parseFile``. Defaults to
+            :class:`~schema.DefaultReader`.
+            
+    Return:
+        tuple: Pair ``(target, error)``. If the file was loaded successfully,
+        error is ``None``, otherwise the :class:`~schema.SchemaError` raised
+        while loading the file, or the :class:`OSError` or
+        :class:`UnicodeError` raised if the file could not be read or decoded.
+        Errors and warnings logged by the reader, e.g. for unmatched input or
+        contexts which were not closed, leave the document incomplete and are
+        reported as :class:`~schema.SchemaError` as well.
+    """
+    context, target= schemaFactory()
+    
+    try:
+        instance= reader(Validator(context))
+        instance.parseFile(path)
+    except (SchemaError, OSError, UnicodeError) as ex:
+        return target, ex
+
+    nErrors  = getattr(instance, "nErrors", 0)
+    nWarnings= getattr(instance, "nWarnings", 0)
+
+    if nErrors or nWarnings:
+        return target, SchemaError("Incomplete document: reader reported "
+                                   "{:d} error(s) and {:d} warning(s)"
+                                   .format(nErrors, nWarnings),
+                                   instance.locator)
+        
+    return target, None
+
+
+def loadMany(paths, schemaFactory, reader=DefaultReader, workers=None):
+    """Load independent files in parallel using a pool of processes
+    
+    Each file is parsed and validated against its own data model in a worker
+    process. The populated target objects are transferred back to the calling
+    process, so they have to be picklable. For the same reason
+    ``schemaFactory`` and ``reader`` have to be defined at module level.
+    
+    Arguments:
+        paths (iterable): Paths of files to load
+        schemaFactory (callable): Data model factory. Refer to :func:`load`
+            for details.
+        reader (type): Reader class. Defaults to
+            :class:`~schema.DefaultReader`.
+        workers (int): Number of worker processes. Defaults to the number of
+            processors. If 1, files are loaded in the calling process.
+            
+    Return:
+        list: List of pairs ``(target, error)`` in the order of ``paths``.
+        Refer to :func:`load` for details.
+    """
+    paths= list(paths)
+    
+    if workers == 1:
+        return [load(path, schemaFactory, reader) for path in paths]
+
+    n= len(paths)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(load, paths, [schemaFactory] * n, [reader] * n))
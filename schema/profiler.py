@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+from time import perf_counter
+
+from .content_handler import ContentHandler
+
+#Kinds of records collected by the profiler
+ENTER  = "enter"
+LEAVE  = "leave"
+CONTENT= "content"
+CONVERT= "convert"
+
+
+class Profiler(object):
+    """Collects call counts and cumulative times per context path
+    
+    Records are added by :class:`~schema.ProfilingContentHandler` for events
+    and by :class:`~schema.Validator` for type conversion of content. Paths
+    are tuples of context names starting at the root context.
+    """
+    def __init__(self):
+        self._stats= dict() #: path -> {kind: [count, time]}
+
+
+    def __len__(self):
+        return len(self._stats)
+
+
+    def clear(self):
+        """Discard all records
+        """
+        self._stats.clear()
+
+
+    def record(self, path, kind, elapsed):
+        """Add a record
+        
+        Arguments:
+            path (tuple): Context path as tuple of names
+            kind (str): One of 'enter', 'leave', 'content' or 'convert'
+            elapsed (float): Elapsed time in seconds
+        """
+        stats= self._stats.get(path)
+        if stats is None:
+            stats= self._stats[path]= dict()
+            
+        item= stats.get(kind)
+        if item is None:
+            stats[kind]= [1, elapsed]
+        else:
+            item[0]+= 1
+            item[1]+= elapsed
+
+
+    def asDict(self):
+        """Export records as dictionary
+        
+        Return:
+            dict: Dictionary with path strings separated by '/' as keys. Each
+            value is a dictionary mapping the record kind to a dictionary with
+            keys 'count' and 'time' (in seconds).
+        """
+        return { "/".join(path): { kind: {"count": count, "time": elapsed}
+                                   for kind, (count, elapsed) in stats.items() }
+                 for path, stats in self._stats.items() }
+
+
+    def folded(self):
+        """Export records as folded stacks
+        
+        The output can be processed by flamegraph tools. Time spent for type
+        conversion is reported in a separate frame ``[convert]`` below the
+        context and subtracted from the time of the context itself.
+        
+        Yield:
+            str: Line ``frame;frame;... microseconds`` per path
+        """
+        for path, stats in self._stats.items():
+            stack= ";".join(path)
+            convert= stats.get(CONVERT, (0, 0.))[1]
+            total= sum(elapsed for kind, (count, elapsed) in stats.items()
+                       if kind != CONVERT)
+
+            if total:
+                yield "{0} {1:d}".format(stack, round(max(total - convert, 0.)
+                                                      * 1e6))
+            if convert:
+                yield "{0};[convert] {1:d}".format(stack, round(convert * 1e6))
+
+
+class ProfilingContentHandler(ContentHandler):
+    """Content handler measuring the time spent in another content handler
+    
+    Forwards all events to the wrapped handler and records count and
+    cumulative time of enter, leave and content events per context path in a
+    :class:`~schema.Profiler`. Insert this handler between a reader and the
+    handler to profile only when profiling is desired.
+    
+    Arguments:
+        contentHandler (:class:`~schema.ContentHandler`): Wrapped handler
+        profiler (:class:`~schema.Profiler`): Profiler to record to. A new
+           profiler is created, if ``None``.
+    """
+    def __init__(self, contentHandler, profiler=None):
+        self._impl   = contentHandler
+        self._path   = list()
+        self.profiler= profiler if profiler is not None else Profiler()
+
+
+    @property
+    def locator(self):
+        """Return the locator of the wrapped handler
+        
+        Return:
+            :class:`~schema.Locator`: Locator object
+        """
+        return self._impl.locator
+
+
+    @locator.setter
+    def locator(self, locator):
+        """Set locator used by the wrapped handler
+        
+        Arguments:
+            locator(`schema.Locator`): Locator object.
+        """
+        self._impl.locator= locator
+
+
+    @property
+    def wantsIgnorable(self):
+        """Whether the wrapped handler processes ignorable content
+        """
+        return self._impl.wantsIgnorable
+
+
+    @property
+    def wantsComments(self):
+        """Whether the wrapped handler processes comments
+        """
+        return self._impl.wantsComments
+
+
+    def open(self):
+        """Open wrapped handler
+        """
+        self._path.clear()
+        self._impl.open()
+
+
+    def close(self):
+        """Close wrapped handler
+        """
+        self._impl.close()
+
+
+    def enter(self, name, **kwargs):
+        """Forward and time enter event
+        
+        Arguments:
+            name (str): Name of context to enter
+            **kwargs: Attributes
+        """
+        self._path.append(name)
+        start= perf_counter()
+        self._impl.enter(name, **kwargs)
+        self.profiler.record(tuple(self._path), ENTER, perf_counter() - start)
+
+
+    def leave(self):
+        """Forward and time leave event
+        """
+        path= tuple(self._path)
+        start= perf_counter()
+        self._impl.leave()
+        self.profiler.record(path, LEAVE, perf_counter() - start)
+        self._path.pop()
+
+
+    def content(self, content):
+        """Forward and time content
+
+        Arguments:
+            content(str): String containing content
+        """
+        start= perf_counter()
+        self._impl.content(content)
+        self.profiler.record(tuple(self._path), CONTENT,
+                             perf_counter() - start)
+
+
+    def comment(self, comment):
+        """Forward comment
+
+        Arguments:
+            comment(str): String containing comment
+        """
+        self._impl.comment(comment)
+
+
+    def ignore(self, content):
+        """Forward ignorable content
+
+        Arguments:
+            content(str): String containing ignorable content
+        """
+        self._impl.ignore(content)
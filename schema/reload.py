@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+import os
+from threading import Thread, Event, Lock
+from time import monotonic, time
+
+from .default_reader import DefaultReader
+from .error_handler import ErrorHandler
+from .parallel import load
+
+
+def signature(path):
+    """Get signature of a file used to detect modifications
+
+    Arguments:
+        path (str): Path of file
+
+    Return:
+        tuple: ``(mtime_ns, size)`` or ``None`` if the file does not exist
+    """
+    try:
+        st= os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class Watcher(ErrorHandler):
+    """Reloads configuration files when they are modified
+
+    Each file is loaded into a new data model obtained from
+    ``schemaFactory``. Only after validation passed, the new target replaces
+    the previous one, so the targets accessible through a watcher are never
+    populated partially. If loading fails, the previous target is kept and the
+    error is stored in :attr:`errors`. This includes exceptions raised by
+    ``schemaFactory``, so the background thread keeps polling.
+
+    Files are polled for modifications either by calling :meth:`poll` or by
+    a background thread started with :meth:`start`. Bursts of writes are
+    debounced: a modified file is reloaded, once its modification time and
+    size have not changed for at least ``delay`` seconds between two polls.
+    This applies to files seen for the first time as well, if they have been
+    modified less than ``delay`` seconds ago.
+
+    Callbacks are invoked after all files have been polled, without holding
+    the internal lock, so they may call :meth:`poll`. Exceptions raised by
+    callbacks are logged and do not stop the background thread.
+
+    Arguments:
+        paths (iterable): Paths of files to watch. A single string is
+            accepted as well.
+        schemaFactory (callable): Data model factory. Refer to
+            :func:`~schema.parallel.load` for details.
+        reader (type): Reader class. Defaults to
+            :class:`~schema.DefaultReader`.
+        interval (float): Polling interval of background thread in seconds.
+            Defaults to 1.
+        delay (float): Minimum time in seconds a modification has to be
+            stable before the file is reloaded. Defaults to 0.2.
+        onReload (callable): Called as ``onReload(path, target)`` after a
+            file has been reloaded successfully. Defaults to ``None``.
+        onError (callable): Called as ``onError(path, error)`` if loading a
+            file failed. Defaults to ``None``.
+
+    Attributes:
+        errors (dict): Dictionary mapping paths to the error of the last
+            failed attempt to load them
+    """
+    def __init__(self, paths, schemaFactory, reader=DefaultReader, interval=1.,
+                 delay=0.2, onReload=None, onError=None):
+        if isinstance(paths, str):
+            paths= [paths]
+
+        self.paths= list(paths)
+        self.schemaFactory= schemaFactory
+        self.reader= reader
+        self.interval= interval
+        self.delay= delay
+        self.onReload= onReload
+        self.onError= onError
+        self.errors= dict()
+        super().__init__(name="schema.reload.Watcher")
+
+        self._targets= dict()
+        self._loaded= dict() #path -> signature of last load
+        self._pending= dict() #path -> (signature, time of detection)
+        self._lock= Lock()
+        self._stop= Event()
+        self._thread= None
+
+
+    def __getitem__(self, path):
+        """Get current target of a file
+
+        Arguments:
+            path (str): Path of file
+
+        Return:
+            object: Target populated from the last successful load
+        """
+        return self._targets[path]
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+    @property
+    def targets(self):
+        """Access current targets
+
+        The dictionary is replaced as a whole on each reload and must not be
+        modified.
+
+        Return:
+            dict: Dictionary mapping paths to targets
+        """
+        return self._targets
+
+
+    @property
+    def isRunning(self):
+        """Check whether the background thread is running
+
+        Return:
+            bool: ``True`` if and only if the background thread is alive
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+
+    def poll(self):
+        """Check all files for modifications and reload modified files
+
+        Files which have not been loaded yet are loaded immediately, unless
+        they have been modified within the last ``delay`` seconds.
+
+        Return:
+            list: Paths of files reloaded successfully
+        """
+        reloaded= list()
+        results= list()
+
+        with self._lock:
+            now= monotonic()
+            modified= time() - self.delay
+
+            for path in self.paths:
+                sig= signature(path)
+
+                if sig is None or sig == self._loaded.get(path):
+                    self._pending.pop(path, None)
+                    continue
+
+                if path in self._loaded or sig[0] > modified * 1e9:
+                    pending= self._pending.get(path)
+
+                    if pending is None or pending[0] != sig:
+                        self._pending[path]= (sig, now)
+                        continue
+
+                    if now - pending[1] < self.delay:
+                        continue
+
+                    del self._pending[path]
+
+                target, error= self._load(path, sig)
+                results.append((path, target, error))
+
+                if error is None:
+                    reloaded.append(path)
+
+        for path, target, error in results:
+            if error is None:
+                self._notify(self.onReload, path, target)
+            else:
+                self._notify(self.onError, path, error)
+
+        return reloaded
+
+
+    def start(self):
+        """Load all files and start polling in a background thread
+        """
+        if self.isRunning:
+            return
+
+        self.poll()
+        self._stop.clear()
+        self._thread= Thread(target=self._run, daemon=True,
+                             name="schema.reload.Watcher")
+        self._thread.start()
+
+
+    def stop(self):
+        """Stop background thread and wait for it to finish
+        """
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread= None
+
+
+    def _run(self):
+        """Poll files until stopped"""
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+
+    def _load(self, path, sig):
+        """Load file into a new target and swap it in on success
+
+        Arguments:
+            path (str): Path of file
+            sig (tuple): Signature of file before loading
+
+        Return:
+            tuple: Pair ``(target, error)``. Refer to
+            :func:`~schema.parallel.load` for details.
+        """
+        self._loaded[path]= sig
+
+        try:
+            target, error= load(path, self.schemaFactory, self.reader)
+        except Exception as ex: #keep background thread alive
+            target, error= None, ex
+
+        if error is not None:
+            self.errors[path]= error
+            return target, error
+
+        targets= dict(self._targets)
+        targets[path]= target
+        self._targets= targets
+        self.errors.pop(path, None)
+        return target, None
+
+
+    def _notify(self, callback, path, arg):
+        """Invoke callback and log exceptions raised by it
+
+        Arguments:
+            callback (callable): ``onReload``, ``onError`` or ``None``
+            path (str): Path of file
+            arg (object): Target or error passed to the callback
+        """
+        if callback is None:
+            return
+
+        try:
+            callback(path, arg)
+        except Exception as ex: #keep background thread alive
+            self.exception("Callback failed: {}".format(ex), locator=path)
@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 
+from sys import intern
+from itertools import chain
+from functools import partial
+
 from .context import Context
+from .mixins import group
+from .mixins.group import Group
 
 class Schema(object):
     """Schema implements a user defined data model
@@ -16,6 +22,8 @@ class Schema(object):
     def __init__(self, context=None):
         self._root= None
         self._stack= list()
+        self._paths= None
+        self._pathRevision= -1
         
         if context is not None:        
             self.open(context)
@@ -37,10 +45,10 @@ class Schema(object):
     def __iter__(self):
         """Iterate over all occurences of the current context
         """
-        try:
+        if self._stack:
             for ctx in self.activeContext:
                 yield ctx.name
-        except IndexError:
+        else:
             yield self._root.name
 
         
@@ -55,13 +63,53 @@ class Schema(object):
         Yield:
             str: Name of each child
         """
-        try:
+        if self._stack:
             for ctx in self.activeContext.children():
                 yield ctx.name
-        except IndexError:
+        else:
             yield self._root.name
 
 
+    def walk(self, context=None):
+        """Iterate depth first over a context and all of its descendants
+        
+        Traversal uses an explicit stack of iterators, so the depth of the
+        tree is not limited by the recursion limit. Each occurrence of a
+        context is yielded separately. Because all occurrences of e.g. a
+        :class:`~schema.mixins.List` are represented by the same object, an
+        occurrence must be processed before the iteration proceeds.
+        
+        Arguments:
+            context (:class:`~schema.Context`): Context to start from. If
+                ``None``, the active context is used or the root context, if
+                no context is active.
+                
+        Yield:
+            tuple: ``(depth, context)`` for each occurrence, where depth is
+            zero for the start context.
+            
+        Raises:
+            RuntimeError: If no root context has been specified
+        """
+        if context is None:
+            context= self.activeContext if self._stack else self._root
+
+        if context is None:
+            raise RuntimeError("No root context specified. Call open first")
+
+        stack= [iter(context)]
+
+        while stack:
+            item= next(stack[-1], None)
+
+            if item is None:
+                stack.pop()
+                continue
+
+            yield len(stack) - 1, item
+            stack.append(chain.from_iterable(item.children()))
+
+
     def open(self, context):
         """Open new context
         
@@ -69,6 +117,10 @@ class Schema(object):
             context (:class:Context): New root context
         """
         self.close()
+
+        if context is not self._root:
+            self._paths= None
+
         self._root= context            
 
         if self._root is None:
@@ -114,11 +166,11 @@ class Schema(object):
             ValueError: If no child with the provided name exists
             RuntimeError: If no root context has been specified
         """
-        child= self._root
-        try:
-            child= self.activeContext.getChild(name)
-        except IndexError:
+        if self._stack:
+            child= self._stack[-1].getChild(name)
+        else:
             #root context is not open -> open it if name fits
+            child= self._root
             if child is None:
                 raise RuntimeError("No root context specified. Call open first")
             if name != child.name:
@@ -145,4 +197,361 @@ class Schema(object):
             content (str): Content string
         """
         self.activeContext.fromString(content)
+
+
+    def lookup(self, path):
+        """Get context by path
+        
+        Paths are relative to the root context and use ``/`` as separator,
+        e.g. ``"section/sub/value"``. The empty path refers to the root
+        context. Lookups are served from an index, which is built on first
+        use and rebuilt after the tree has been modified.
+        
+        Arguments:
+            path (str): Path of context relative to root context
+            
+        Return:
+            :class:`~schema.Context`: Context at ``path``
+            
+        Raises:
+            ValueError: If no context exists at ``path``
+            :class:`~schema.ContextError`: If a context on ``path`` does not
+                support children
+            RuntimeError: If no root context has been specified
+        """
+        context= self.pathIndex().get(path)
+
+        if context is not None:
+            return context
+
+        #not indexed, e.g. below a proxy: resolve step by step
+        context= self._root
+        for name in path.split("/"):
+            context= context.getChild(name)
+        return context
+
+
+    def paths(self):
+        """Iterate over paths of all indexed contexts
+        
+        Yield:
+            str: Path of each context below the root context in depth first
+            order
+        """
+        paths= iter(self.pathIndex())
+        next(paths) #skip root
+        yield from paths
+
+
+    def pathIndex(self):
+        """Get index mapping paths to contexts
+        
+        Contexts resolving their children at runtime (e.g.
+        :class:`~schema.mixins.Proxy`) are indexed, but their children are
+        not.
+        
+        Return:
+            dict: Dictionary mapping interned path strings to contexts
+            
+        Raises:
+            RuntimeError: If no root context has been specified
+        """
+        if self._paths is not None and self._pathRevision == group.revision():
+            return self._paths
+
+        if self._root is None:
+            raise RuntimeError("No root context specified. Call open first")
+
+        self._pathRevision= group.revision()
+        self._paths= paths= dict()
+        pending= [("", self._root)]
+
+        while pending:
+            path, ctx= pending.pop()
+            paths[path]= ctx
+
+            if type(ctx).getChild is not Group.getChild:
+                continue
+
+            prefix= path + "/" if path else ""
+            for child in reversed(list(ctx.children())):
+                pending.append((intern(prefix + child.name), child))
+
+        return paths
+
+
+    def compile(self):
+        """Compile the context graph into a flat transition table
+        
+        The returned schema implements the same interface as this schema, but
+        resolves children by table lookup instead of walking context objects.
+        The table is rebuilt when the schema is opened or reset after children
+        of any group were inserted or replaced.
+        
+        Return:
+            :class:`~schema.CompiledSchema`: Compiled schema with the same
+            root context as this schema
+        """
+        if self._root is None:
+            raise RuntimeError("No root context specified. Call open first")
+
+        return CompiledSchema(self._root)
+
+
+
+class CompiledSchema(Schema):
+    """Schema backed by a flat transition table
+    
+    Each context reachable from the root is assigned an integer state id.
+    Transitions between states are stored in a single dictionary mapping
+    ``(state, name)`` to the state of the child context. The ``open``,
+    ``close`` and ``fromString`` methods of each state are bound once
+    during compilation.
+    
+    Children of contexts, which resolve their children at runtime (e.g.
+    :class:`~schema.mixins.Proxy`), cannot be tabulated. For such contexts
+    the child is obtained from :meth:`~schema.Context.getChild` and compiled
+    on first use.
+    
+    Opening a group resets all of its children, including the entire
+    sub-tree of child groups, so a value at depth ``n`` is reset ``n + 1``
+    times. For plain groups, i.e. contexts whose ``open``, ``reset`` and
+    ``getChild`` are those of :class:`~schema.mixins.Group`, the reset of
+    child groups is deferred: if a child group is entered before its parent
+    is left, opening it resets its children anyway, otherwise it is reset
+    when the parent is left. The final content is identical, but each value is
+    reset once.
+    
+    The table is compiled again by :meth:`open` (and thus by :meth:`reset`),
+    if the tree has been modified since it was compiled, as indicated by
+    :func:`schema.mixins.group.revision`.
+    
+    Arguments:
+        context (:class:`~schema.Context`): Root context forming the base of
+            the data model
+    """
+    def __init__(self, context=None):
+        self._compiled= None
+        self._revision= -1 #: Group revision at compile time
+        self._pending = dict() #: state -> child group states not yet reset
+        super().__init__(context)
+
+
+    @property
+    def activeContext(self):
+        """Access currently active context
+        
+        Return:
+            :class:`~schema.Context` : Currently active context
+            
+        Raises:
+            IndexError: If no context has been opened yet
+        """
+        return self._contexts[self._stack[-1]]
+
+
+    @property
+    def transitions(self):
+        """Access transition table
+        
+        Return:
+            dict: Dictionary mapping ``(state, name)`` to child state
+        """
+        return self._transitions
+
+
+    def states(self):
+        """Iterate over all compiled states
+        
+        Yield:
+            tuple: ``(state, context)`` for each compiled context
+        """
+        yield from enumerate(self._contexts)
+
+
+    def open(self, context):
+        """Open new context and compile it, if it differs from the last one
+        
+        Arguments:
+            context (:class:Context): New root context
+        """
+        super().open(context)
+
+        if context is not self._compiled or \
+           self._revision != group.revision():
+            self._revision= group.revision()
+            self._contexts= list()
+            self._ids= dict()
+            self._transitions= dict()
+            self._open= list()
+            self._close= list()
+            self._fromString= list()
+            self._resets= list()
+            self._groups= list()
+            self._pending.clear()
+            self._state(context)
+            self._compiled= context
+
+
+    def enter(self, name, **kwargs):
+        """Enter a new context
+        
+        Arguments:
+            name (str): Name of context to enter
+            **kwargs : Additional arguments passed to context upon opening
+            
+        Raises:
+            ValueError: If no child with the provided name exists
+            RuntimeError: If no root context has been specified
+        """
+        stack= self._stack
+
+        if stack:
+            parent= stack[-1]
+            state= self._transitions.get((parent, name))
+
+            if state is None:
+                state= self._state(self._contexts[parent].getChild(name))
+
+            pending= self._pending.get(parent)
+
+            if pending and state in pending:
+                del pending[state]
+                if not kwargs.get("resetChildren", True):
+                    self._contexts[state].reset()
+        else:
+            if self._root is None:
+                raise RuntimeError("No root context specified. Call open first")
+            if name != self._root.name:
+                raise ValueError("Invalid root context", name, self._root.name)
+            state= 0
+
+        self._open[state](**kwargs)
+        stack.append(state)
+
+
+    def leave(self):
+        """Leave the current context
+        
+        Child groups, which have not been entered, are reset before the
+        context is closed.
+        """
+        state= self._stack[-1]
+        pending= self._pending.pop(state, None)
+
+        if pending:
+            for child in pending:
+                self._contexts[child].reset()
+
+        self._close[state]()
+        self._stack.pop()
+
+
+    def content(self, content):
+        """Add content to content buffer
+        
+        Arguments:
+            content (str): Content string
+        """
+        self._fromString[self._stack[-1]](content)
+
+
+    def compile(self):
+        """Return this schema, which is already compiled
+        
+        Return:
+            :class:`~schema.CompiledSchema`: ``self``
+        """
+        return self
+
+
+    def _state(self, context):
+        """Get state of a context, compiling it and its children if required
+        
+        Arguments:
+            context (:class:`~schema.Context`): Context to look up
+            
+        Return:
+            int: State id of context
+        """
+        state= self._ids.get(id(context))
+
+        if state is not None:
+            return state
+
+        state= self._addState(context)
+        pending= [(state, context)]
+
+        while pending:
+            parent, ctx= pending.pop()
+            
+            if type(ctx).getChild is not Group.getChild:
+                continue
+
+            resets= list()
+            groups= list()
+
+            for child in ctx.children():
+                childState= self._ids.get(id(child))
+
+                if childState is None:
+                    childState= self._addState(child)
+                    pending.append((childState, child))
+
+                self._transitions[(parent, child.name)]= childState
+
+                if self._groups[childState] is None:
+                    resets.append(child.reset)
+                else:
+                    groups.append(childState)
+
+            if self._groups[parent] is not None:
+                self._resets[parent]= tuple(resets)
+                self._groups[parent]= tuple(groups)
+
+        return state
+
+
+    def _addState(self, context):
+        """Assign a new state id to a context
+        
+        Arguments:
+            context (:class:`~schema.Context`): Context to add
+            
+        Return:
+            int: New state id
+        """
+        state= len(self._contexts)
+        self._ids[id(context)]= state
+        self._contexts.append(context)
+        self._close.append(context.close)
+        self._fromString.append(context.fromString)
+        
+        cls= type(context)
+        if cls.open is Group.open and cls.reset is Group.reset and \
+           cls.getChild is Group.getChild:
+            self._open.append(partial(self._openGroup, state))
+            self._resets.append(())
+            self._groups.append(()) #filled in by _state
+        else:
+            self._open.append(context.open)
+            self._resets.append(None)
+            self._groups.append(None)
+
+        return state
+
+
+    def _openGroup(self, state, resetChildren=True, **kwargs):
+        """Open a plain group deferring the reset of child groups
+        
+        Arguments:
+            state (int): State of group
+            resetChildren (bool): If ``True`` all children are reset.
+            **kwargs: Ignored keyword arguments like in
+                :meth:`~schema.mixins.Group.open`
+        """
+        if resetChildren:
+            for reset in self._resets[state]:
+                reset()
+            self._pending[state]= dict.fromkeys(self._groups[state])
         
\ No newline at end of file
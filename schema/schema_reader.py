@@ -1,47 +1,73 @@
 # -*- coding: utf-8 -*-
+from itertools import islice
+
+from .content_handler import ENTER, LEAVE, CONTENT
+
 
 class SchemaReader(object):
     """Reader for :class:`~Schema` objects
-    
-    Extracts data from a :class:`~schema.Schema` and forwards it to any 
-    :class:`schema.ContentHandler` derived content handler. 
-        
+
+    Extracts data from a :class:`~schema.Schema` and forwards it to any
+    :class:`schema.ContentHandler` derived content handler. The schema is
+    traversed with :meth:`~schema.Schema.walk`, so the depth of the exported
+    tree is not limited by the recursion limit.
+
     Arguments:
         contentHandler (:class:`~schema.ContentHandler`): Destination content
             handler. All content extracted from the input schema is directed
             to this handler.
+        batchSize (int): Number of events passed to
+            :meth:`~schema.ContentHandler.events` at once. Defaults to 1024.
     """
-    def __init__(self, contentHandler):
+    def __init__(self, contentHandler, batchSize=1024):
         self._dest= contentHandler
-        self._attrs  = dict()
+        self.batchSize= batchSize
 
 
     def __call__(self, schema):
         """Invoke reader
-        
+
         Arguments:
             schema (:class:`~schema.Schema`): Schema to read
         """
-        schema.reset()
+        events= self.events(schema)
         self._dest.open()
-        self._dump(schema)
+
+        batch= list(islice(events, self.batchSize))
+        while batch:
+            self._dest.events(batch)
+            batch= list(islice(events, self.batchSize))
+
         self._dest.close()
 
-   
-    def _dump(self, schema):
-        """Forward context to dispatcher
-        
+
+    def events(self, schema):
+        """Iterate lazily over the content of a schema
+
+        Events are generated on demand while the schema is traversed, so
+        they can be streamed e.g. into a writer without building up
+        intermediate state.
+
         Arguments:
-           context (:class:`~schema.Context`): Context to read and forward to
-               destination handler.
+            schema (:class:`~schema.Schema`): Schema to read
+
+        Yield:
+            tuple: ``(opcode, payload)`` as accepted by
+            :meth:`~schema.ContentHandler.events`
         """
-        for name in schema.children():
-            schema.enter(name)
-            ctx= schema.activeContext
-            for item in ctx:
-                self._dest.enter(item.name, attrs=item.attributes)
-                self._dest.content( str(item) )
-                self._dump(schema)
-                self._dest.leave()
-            schema.leave()
-    
\ No newline at end of file
+        schema.reset()
+        leave= (LEAVE, None)
+        level= 0 #number of open contexts
+
+        for depth, item in schema.walk():
+            while level > depth:
+                yield leave
+                level-= 1
+
+            yield ENTER, (item.name, item.attributes)
+            yield CONTENT, str(item)
+            level+= 1
+
+        while level:
+            yield leave
+            level-= 1
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
+from time import perf_counter
 
-from .content_handler import ContentHandler
+from .content_handler import ContentHandler, ENTER, LEAVE, CONTENT
 from .content_buffer import ContentBuffer
 from .context import Context
 from .schema import Schema
 from .error import SchemaError
+from .profiler import CONVERT
 
 
 #TODO need a validator test case ? Maybe validate this in combination with
@@ -26,15 +28,44 @@ class Validator(ContentHandler):
             schema against which to validate. If this is a context object,
             it will be converted to a schema using the :class:~schema.Schema
             constructor.
+        profiler (:class:`~schema.Profiler`): If not ``None``, the time spent
+            to convert content of each context is recorded in this profiler.
+            Defaults to ``None``, which disables profiling at no cost.
+        compiled (bool): If ``True``, the schema is compiled into a flat
+            transition table (see :meth:`~schema.Schema.compile`) before
+            validation, and events are passed to the compiled schema without
+            the intermediate calls of the generic implementation. Defaults to
+            ``False``.
+            
+    Raises:
+        ValueError: If both ``profiler`` and ``compiled`` are given, because
+            compiled mode bypasses the profiled conversion.
     """
-    def __init__(self, schema):
+    wantsIgnorable= False
+    wantsComments = False
+
+    def __init__(self, schema, profiler=None, compiled=False):
         if isinstance(schema, Context):
             self._schema= Schema(context= schema)
         else:
             self._schema= schema
-            
+
+        if profiler is not None and compiled:
+            raise ValueError("Profiling is not supported in compiled mode")
+
         self._buffer = ContentBuffer()
+        self._chunks = list() #: Content chunks of compiled mode
         self._locator= None
+        self._profiler= profiler
+
+        if profiler is not None:
+            self.flushBuffer= self._profiledFlushBuffer
+        elif compiled:
+            self._schema= self._schema.compile()
+            self.enter  = self._compiledEnter
+            self.leave  = self._compiledLeave
+            self.content= self._chunks.append
+            self.events = self._compiledEvents
 
 
     @property
@@ -66,8 +97,10 @@ class Validator(ContentHandler):
         """Open the schema
         
         Make sure the current schema is valid and the cursor is placed at the
-        root node.
+        root node. Content left over from an aborted document is discarded.
         """
+        self._buffer.clear()
+        self._chunks.clear()
         self._schema.reset()
         
 
@@ -113,6 +146,27 @@ class Validator(ContentHandler):
             content(str): String containing content
         """
         self._buffer.add(content)
+
+
+    def events(self, batch):
+        """Process a batch of events
+        
+        Content is added to the buffer directly, comments and ignorable
+        content are dropped without further calls.
+        
+        Arguments:
+            batch (list): List of ``(opcode, payload)`` tuples
+        """
+        add= self._buffer.add
+
+        for opcode, payload in batch:
+            if opcode == CONTENT:
+                add(payload)
+            elif opcode == ENTER:
+                name, attrs= payload
+                self.enter(name, **attrs)
+            elif opcode == LEAVE:
+                self.leave()
        
        
     def flushBuffer(self):
@@ -125,4 +179,88 @@ class Validator(ContentHandler):
             self._schema.content( self._buffer.flush() )
         except Exception as ex:
             raise SchemaError(str(ex), self.locator)
+
+
+    def _compiledEnter(self, name, **kwargs):
+        """Implementation of :meth:`enter` in compiled mode
+        """
+        schema= self._schema
+        chunks= self._chunks
+
+        try:
+            if schema.isActive:
+                schema.content("".join(chunks))
+                chunks.clear()
+
+            schema.enter(name, **kwargs)
+        except SchemaError:
+            raise
+        except Exception as ex:
+            raise SchemaError(str(ex), self.locator)
+
+
+    def _compiledLeave(self):
+        """Implementation of :meth:`leave` in compiled mode
+        """
+        schema= self._schema
+        chunks= self._chunks
+
+        try:
+            schema.content("".join(chunks))
+        except SchemaError:
+            raise
+        except Exception as ex:
+            raise SchemaError(str(ex), self.locator)
+
+        chunks.clear()
+        schema.leave()
+
+
+    def _compiledEvents(self, batch):
+        """Implementation of :meth:`events` in compiled mode
         
+        Calls the methods of the compiled schema directly. Comments and
+        ignorable content are dropped.
+        """
+        schema = self._schema
+        chunks = self._chunks
+        add    = chunks.append
+        clear  = chunks.clear
+        join   = "".join
+        enter  = schema.enter
+        leave  = schema.leave
+        content= schema.content
+
+        try:
+            for opcode, payload in batch:
+                if opcode == CONTENT:
+                    add(payload)
+                elif opcode == ENTER:
+                    if schema.isActive:
+                        content(join(chunks))
+                        clear()
+                    name, attrs= payload
+                    enter(name, **attrs)
+                elif opcode == LEAVE:
+                    content(join(chunks))
+                    clear()
+                    leave()
+        except SchemaError:
+            raise
+        except Exception as ex:
+            raise SchemaError(str(ex), self.locator)
+
+
+    def _profiledFlushBuffer(self):
+        """Flush buffer and record time spent in conversion to profiler
+        """
+        path= list()
+        ctx= self._schema.activeContext
+        while ctx is not None:
+            path.append(ctx.name)
+            ctx= ctx.parent
+        path.reverse()
+
+        start= perf_counter()
+        Validator.flushBuffer(self)
+        self._profiler.record(tuple(path), CONVERT, perf_counter() - start)
@@ -1,11 +1,36 @@
 # -*- coding: utf-8 -*-
-from .content_handler import ContentHandler
+from .content_handler import ContentHandler, ENTER, LEAVE, CONTENT, COMMENT
 from .content_buffer import ContentBuffer
 
 PENDING= 1
 BRANCH = 2
 LEAF   = 3
 
+#Indentation strings by depth for each indentation width, shared by all
+#writers. Tables are replaced rather than modified when they are extended.
+_indentations= dict()
+
+
+def indentations(width, depth):
+    """Get table of indentation strings covering at least a given depth
+    
+    Arguments:
+        width (int): Number of spaces per indentation level
+        depth (int): Minimum depth covered by the table
+        
+    Return:
+        list: List of indentation strings indexed by depth
+    """
+    table= _indentations.get(width, ())
+
+    if depth >= len(table):
+        size= max(2 * depth + 1, 32)
+        table= [" " * (width * i) for i in range(size)]
+        _indentations[width]= table
+
+    return table
+
+
 class WriterBase(ContentHandler):
     """Generic base class for writer objects
     
@@ -15,6 +40,9 @@ class WriterBase(ContentHandler):
     determines the context type and invokes the functions enterLeaf and
     enterBranch, which shall be implemented in the derived class.
     """
+    wantsIgnorable= False
+    indent= 2 #: Number of spaces per indentation level
+
     def __init__(self):
         self._currentContext= None
         self._pendingContext= None
@@ -158,6 +186,28 @@ class WriterBase(ContentHandler):
             content(str): String containing potentially ignorable content
         """
         return
+
+
+    def events(self, batch):
+        """Process a batch of events
+        
+        Ignorable content is dropped without further calls.
+        
+        Arguments:
+            batch (list): List of ``(opcode, payload)`` tuples
+        """
+        content= self.content
+
+        for opcode, payload in batch:
+            if opcode == CONTENT:
+                content(payload)
+            elif opcode == ENTER:
+                name, attrs= payload
+                self.enter(name, **attrs)
+            elif opcode == LEAVE:
+                self.leave()
+            elif opcode == COMMENT:
+                self.comment(payload)
                
         
     def enterBranch(self, name, **kwargs):
@@ -216,6 +266,26 @@ class WriterBase(ContentHandler):
         raise NotImplementedError("To be implemented by derived class")
 
 
+    def indentation(self, depth):
+        """Get indentation string for a given depth
+        
+        Strings are taken from a table shared by all writers with the same
+        indentation width, which is extended on demand.
+        
+        Arguments:
+            depth (int): Nesting depth
+            
+        Return:
+            str: String consisting of ``depth * self.indent`` spaces
+        """
+        table= _indentations.get(self.indent, ())
+
+        if depth < len(table):
+            return table[depth]
+
+        return indentations(self.indent, depth)[depth]
+
+
     def split(self, content, maxLen=80):
         """Split long content lines
         
@@ -3,4 +3,5 @@
 from .sax_locator_adapter import SaxLocatorAdapter
 from .sax_error_handler import SaxErrorHandler
 from .sax_reader import SaxReader
+from .expat_reader import ExpatReader, ExpatLocator
 from .xml_writer import XmlWriter
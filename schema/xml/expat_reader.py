@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+from types import SimpleNamespace
+from xml.parsers import expat
+
+from ..error import SchemaError
+
+
+class ExpatLocator(object):
+    """Locator reporting the current position of an expat parser
+
+    Arguments:
+        parser (:class:`xml.parsers.expat.xmlparser`): Parser to track.
+    """
+    def __init__(self, parser=None):
+        self.parser= parser
+
+
+    def __str__(self):
+        """Convert current locator to string
+
+        This method is used by various error reporting routines
+        """
+        return "{:d}:{:d}".format(self.line, self.column)
+
+
+    @property
+    def line(self):
+        return self.parser.CurrentLineNumber
+
+
+    @property
+    def column(self):
+        return self.parser.CurrentColumnNumber
+
+
+
+class ExpatReader(object):
+    """XML reader driving an expat parser directly
+
+    Equivalent to a :class:`~schema.xml.SaxReader` attached to a SAX parser,
+    but without the SAX layer: Attributes are passed on as plain
+    dictionaries and character data is forwarded to the content handler
+    without intermediate calls. Adjacent character data is merged by the
+    parser up to ``bufferSize`` characters. Comments are dropped like in the
+    SAX path.
+    
+    Documents can be parsed at once or fed incrementally in chunks using
+    :meth:`feed` and :meth:`close`. Content is passed to the content handler
+    as soon as it has been parsed, so errors are reported early and memory
+    consumption does not depend on the size of the document.
+
+    Arguments:
+        contentHandler (:class:`~schema.ContentHandler`): Content handler.
+        bufferSize (int): Size of expat's character data buffer and of the
+            chunks read from input streams. Defaults to 65536.
+    """
+    def __init__(self, contentHandler, bufferSize=65536):
+        self._impl= contentHandler
+        self.bufferSize= bufferSize
+        self._parser= None
+        self._locator= ExpatLocator()
+
+
+    @property
+    def locator(self):
+        """Access locator of the current document
+
+        Return:
+            :class:`~schema.xml.ExpatLocator`: Locator object
+        """
+        return self._locator
+
+
+    def parse(self, inputStream):
+        """Parse input stream
+
+        Arguments:
+            inputStream: Stream opened in binary mode providing ``read``
+        """
+        self.startDocument()
+        read= inputStream.read
+        chunk= read(self.bufferSize)
+
+        while chunk:
+            self.feed(chunk)
+            chunk= read(self.bufferSize)
+
+        self.close()
+
+
+    def parseBuffer(self, buffer):
+        """Parse an entire document held in memory
+
+        Arguments:
+            buffer: :class:`bytes`, :class:`str` or any object supporting the
+                buffer protocol.
+        """
+        self.startDocument()
+        self._parse(buffer, True)
+        self._parser= None
+        self.endDocument()
+
+
+    def parseFile(self, path):
+        """Parse a file
+
+        Arguments:
+            path (str): Path of file to parse
+        """
+        with open(path, "rb") as f:
+            self.parse(f)
+
+
+    def feed(self, data):
+        """Parse the next chunk of a document
+        
+        A new document is started with the first chunk fed after
+        construction, after :meth:`close` or after an error.
+        
+        Arguments:
+            data: Chunk of input data. Chunks need not be aligned with
+                elements or characters.
+                
+        Raises:
+            :class:`~schema.SchemaError`: If the input is not well-formed XML
+                or rejected by the content handler
+        """
+        if self._parser is None:
+            self.startDocument()
+
+        self._parse(data, False)
+
+
+    def close(self):
+        """Finish the current document
+        
+        Raises:
+            :class:`~schema.SchemaError`: If the document is incomplete
+        """
+        if self._parser is None:
+            self.startDocument()
+
+        self._parse(b"", True)
+        self._parser= None
+        self.endDocument()
+
+
+    def startDocument(self):
+        """Create a new parser and open the content handler
+        """
+        impl= self._impl
+        parser= expat.ParserCreate()
+        parser.buffer_text= True
+        parser.buffer_size= self.bufferSize
+        parser.StartElementHandler= self.startElement
+        parser.EndElementHandler= self.endElement
+        parser.CharacterDataHandler= impl.content
+        parser.ProcessingInstructionHandler= self.processingInstruction
+
+        self._parser= parser
+        self._locator.parser= parser
+        impl.locator= self._locator
+        impl.open()
+
+
+    def endDocument(self):
+        """Close the content handler
+        """
+        self._impl.close()
+
+
+    def startElement(self, name, attrs):
+        """Forward start of an element to the content handler
+
+        Arguments:
+            name (str): Element name
+            attrs (dict): Element attributes
+        """
+        self._impl.enter(name, **attrs)
+
+
+    def endElement(self, name):
+        """Forward end of an element to the content handler
+
+        Arguments:
+            name (str): Element name
+        """
+        self._impl.leave()
+
+
+    def processingInstruction(self, target, data):
+        """Processing instructions are not supported
+        """
+        raise NotImplementedError("Processing Instructions are not supported")
+
+
+    def _parse(self, data, isFinal):
+        """Pass data to the parser and convert syntax errors
+
+        Arguments:
+            data: Chunk of input data
+            isFinal (bool): Whether this is the last chunk of the document
+
+        Raises:
+            :class:`~schema.SchemaError`: If the input is not well-formed XML
+        """
+        try:
+            self._parser.Parse(data, isFinal)
+        except expat.ExpatError as ex:
+            self._parser= None
+            raise SchemaError(expat.errors.messages[ex.code],
+                              SimpleNamespace(line=ex.lineno,
+                                              column=ex.offset)) from ex
+        except BaseException:
+            self._parser= None
+            raise
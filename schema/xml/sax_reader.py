@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import asyncio
+from xml.sax import make_parser
 from xml.sax.handler import ContentHandler as SaxContentHandler
 from .sax_locator_adapter import SaxLocatorAdapter
 
@@ -17,11 +19,99 @@ class SaxReader(SaxContentHandler):
     interface (see e.g. :class:`~schema.WriterBase` or
     :class:`~schema.XmlWriter`).
     
+    Documents can also be fed in chunks using :meth:`feed` and :meth:`close`,
+    which are backed by an incremental SAX parser.
+    
     Arguments:
         contentHandler (:class:`~schema.ContentHandler`): Content handler.   
+        errorHandler (:class:`~schema.xml.SaxErrorHandler`): SAX error
+            handler of parsers created by this reader. If ``None``, the
+            default SAX error handler is used.
     """
-    def __init__(self, contentHandler):
+    def __init__(self, contentHandler, errorHandler=None):
         self._impl= contentHandler
+        self.errorHandler= errorHandler
+        self._parser= None
+
+
+    def createParser(self, errorHandler=None):
+        """Create incremental SAX parser reporting to this reader
+        
+        Arguments:
+            errorHandler (:class:`~schema.xml.SaxErrorHandler`): SAX error
+                handler. Defaults to the error handler of this reader.
+                
+        Return:
+            :class:`xml.sax.xmlreader.IncrementalParser`: New parser
+        """
+        parser= make_parser()
+        parser.setContentHandler(self)
+        #parsers announce their locator only when parsing a complete source
+        self.setDocumentLocator(parser)
+
+        if errorHandler is None:
+            errorHandler= self.errorHandler
+        if errorHandler is not None:
+            parser.setErrorHandler(errorHandler)
+
+        return parser
+
+
+    def feed(self, data):
+        """Parse the next chunk of a document
+        
+        A new document is started with the first chunk fed after
+        construction, after :meth:`close` or after an error. Content is
+        forwarded as soon as it has been parsed, so errors are reported
+        early and memory consumption does not depend on the document size.
+        
+        Arguments:
+            data: Chunk of input data. Chunks need not be aligned with
+                elements or characters.
+        """
+        if self._parser is None:
+            self._parser= self.createParser()
+
+        try:
+            self._parser.feed(data)
+        except BaseException:
+            self._parser= None
+            raise
+
+
+    def close(self):
+        """Finish the current document
+        """
+        parser= self._parser or self.createParser()
+        self._parser= None
+        parser.close()
+
+
+    async def parseAsync(self, inputStream, errorHandler=None,
+                         chunkSize=16384):
+        """Parse XML input from an asynchronous source
+        
+        Chunks are fed to an incremental SAX parser as they arrive. Large
+        chunks are split into pieces of at most ``chunkSize`` characters and
+        control is returned to the event loop after each piece, so large
+        documents do not block the loop.
+        
+        Arguments:
+            inputStream: Asynchronous iterable of :class:`bytes` or
+                :class:`str` chunks
+            errorHandler (:class:`~schema.xml.SaxErrorHandler`): SAX error
+                handler. Defaults to the error handler of this reader.
+            chunkSize (int): Maximum size of data fed to the parser at once.
+                Defaults to 16384.
+        """
+        self._parser= self.createParser(errorHandler)
+
+        async for chunk in inputStream:
+            for begin in range(0, len(chunk), chunkSize):
+                self.feed(chunk[begin:begin + chunkSize])
+                await asyncio.sleep(0)
+
+        self.close()
    
 
     def setDocumentLocator(self, saxLocator):
@@ -1,78 +1,140 @@
 # -*- coding: utf-8 -*-
-from xml.sax.saxutils import XMLGenerator
+import io
+import codecs
+from xml.sax.saxutils import quoteattr
 from sys import stdout
 
 from schema.writer_base import WriterBase
 
 
+def escape(content):
+    """Escape '&', '<' and '>' in character data
+
+    Arguments:
+        content (str): Character data
+
+    Return:
+        str: Escaped character data
+    """
+    if "&" in content:
+        content= content.replace("&", "&amp;")
+    if "<" in content:
+        content= content.replace("<", "&lt;")
+    if ">" in content:
+        content= content.replace(">", "&gt;")
+    return content
+
+
 class XmlWriter(WriterBase):
-    """SAX Writer for XML files
-    
+    """Writer for XML files
+
     XML writer implementing the :class:`~schema.ContentHandler` interface. The
     writer allows to produce XML output from content created by any reader
-    exporting to :class:`~schema.ContentHandler` objects, such as 
+    exporting to :class:`~schema.ContentHandler` objects, such as
     :class:`~schema.xml.SaxReader` or :class:`~schema.SchemaReader`.
 
+    The output is identical to the output of
+    :class:`xml.sax.saxutils.XMLGenerator`, but markup is generated directly
+    and collected in an internal buffer, which is written to the output
+    stream in large chunks. Text streams receive strings, all other streams
+    receive data encoded in the output encoding.
+
     Arguments:
         os (stream): Output stream
         encoding (str): Output encoding.
+        bufferSize (int): Number of strings buffered before the buffer is
+            written to the output stream. Defaults to 4096.
     """
-    def __init__(self, os=stdout, encoding="utf-8"):
+    def __init__(self, os=stdout, encoding="utf-8", bufferSize=4096):
         super().__init__()
-        self._impl= XMLGenerator(os, encoding=encoding)
         self.indent= 2;
+        self.bufferSize= bufferSize
+        self._os= os
+        self._encoding= encoding
+        self._binary= not isinstance(os, (io.TextIOBase, codecs.StreamWriter,
+                                          codecs.StreamReaderWriter))
+        self._out= list() #: Buffered output strings
         self._stack= []
-                           
+
 
     def open(self):
         """Start new document
         """
         super().open()
-        self._impl.startDocument()
+        self.flush()
         self._stack.clear()
-    
-    
+        self._out.append('<?xml version="1.0" encoding="{0}"?>\n'
+                         .format(self._encoding))
+
+
     def close(self):
         """End current document
         """
         super().close()
-        self._impl.endDocument()
-    
-    
+        self.flush()
+        self._os.flush()
+
+
+    def flush(self):
+        """Write buffered output to output stream
+        """
+        if not self._out:
+            return
+
+        data= "".join(self._out)
+        self._out.clear()
+
+        if self._binary:
+            self._os.write(data.encode(self._encoding, "xmlcharrefreplace"))
+        else:
+            self._os.write(data)
+
+
     def enterLeaf(self, name, **kwargs):
         """Enter leaf node
-        
+
         Arguments:
             name (:class:`str`): Name of node
             **kwargs: Optional keyword arguments
         """
-        self._indent()
-        self._impl.startElement(name, kwargs)
+        out= self._out
+        out.append(self.indentation(len(self._stack)))
+
+        if kwargs:
+            out.append("<{0}{1}>".format(name, "".join(
+                " {0}={1}".format(key, quoteattr(value))
+                for key, value in kwargs.items() )))
+        else:
+            out.append("<" + name + ">")
+
         self._stack.append(name)
 
-        
+
     def enterBranch(self, name, **kwargs):
         """Enter branch node
-        
+
         Arguments:
             name (str): Name of node
             **kwargs: Optional keyword arguments
         """
         self.enterLeaf(name, **kwargs)
-        self._impl.ignorableWhitespace("\n")
-        
-        
+        self._out.append("\n")
+
+
     def exitLeaf(self):
         """Exit current leaf node
         """
-        self._impl.endElement( self._stack.pop() )
-        self._impl.ignorableWhitespace("\n")
+        out= self._out
+        out.append("</" + self._stack.pop() + ">\n")
+
+        if len(out) >= self.bufferSize or not self._stack:
+            self.flush()
 
 
     def exitBranch(self):
         """Exit current branch node
         """
-        self._indent(-1)
+        self._out.append(self.indentation(len(self._stack) - 1))
         self.exitLeaf()
 
 
@@ -82,24 +144,15 @@ class XmlWriter(WriterBase):
         Arguments:
             content(str): String containing content
         """
-        self._impl.characters(content)
-        
-       
+        if content:
+            self._out.append(escape(content))
+
+
     def writeComment(self, comment):
         """Add comment to current context
 
         Arguments:
             comment(str): String containing comment
         """
-        self._indent()
-        self._impl.ignorableWhitespace("<!--{0}-->\n".format(comment))
-        
-
-    def _indent(self, shift=0):
-        """Print indentation level
-        
-        Arguments:
-           shift (int) : Shift indentation level by this amount
-        """
-        self._impl.ignorableWhitespace( self.indent * " "
-                                        * (shift + len(self._stack) ) )
+        self._out.append(self.indentation(len(self._stack)))
+        self._out.append("<!--{0}-->\n".format(comment))
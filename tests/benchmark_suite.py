@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import unittest
+import json
+import os
+
+from io import StringIO
+from tempfile import TemporaryDirectory
+from contextlib import redirect_stderr
+
+from schema import DefaultReader, IniReader, Validator
+from benchmarks.generate import defaultConfig, defaultSchema, iniConfig, \
+                                iniSchema, value
+from benchmarks.suite import BENCHMARKS, MEMORY_BENCHMARKS, run
+from benchmarks.run_benchmarks import main
+
+
+class BenchmarkSuiteTestCase(unittest.TestCase):
+
+    def test_defaultConfig(self):
+        context, target= defaultSchema(depth=2, width=3)
+        DefaultReader(Validator(context)).parseBuffer(defaultConfig(2, 3, 10))
+        self.assertEqual(target.value0, "value0valu")
+        self.assertEqual(target.section2_section1_value2,
+                         value("section2_section1_value2", 10))
+
+
+    def test_iniConfig(self):
+        context, target= iniSchema(sections=4, width=3)
+        IniReader(Validator(context)).parseBuffer(iniConfig(4, 3, 5))
+        self.assertEqual(target.value2, "value")
+        self.assertEqual(target.section3_value1, "secti")
+
+
+    def test_run(self):
+        results= run(depth=1, width=2, valueLength=4, deepDepth=20,
+                     lineValues=50, repeat=2)
+        self.assertEqual(set(results["results"]), set(BENCHMARKS))
+        
+        for name, result in results["results"].items():
+            self.assertEqual(len(result["times"]), 2)
+            self.assertLessEqual(result["min"], result["mean"])
+
+        self.assertEqual(set(results["memory"]), set(MEMORY_BENCHMARKS))
+        self.assertEqual(results["memory"]["schemaMemory"]["count"], 9)
+        self.assertGreater(results["memory"]["schemaMemory"]["bytes"], 0)
+
+        out= StringIO()
+        json.dump(results, out)
+        self.assertEqual(json.loads(out.getvalue())["parameters"]["width"], 2)
+
+
+    def test_main(self):
+        with TemporaryDirectory() as tmpDir:
+            path= os.path.join(tmpDir, "results.json")
+            main(["schemaMemory", "--depth", "1", "--width", "2", "-o", path])
+            with open(path) as f:
+                results= json.load(f)
+        self.assertEqual(set(results["memory"]), {"schemaMemory"})
+
+        with redirect_stderr(StringIO()) as err:
+            with self.assertRaises(SystemExit):
+                main(["schemaMemory", "unknown"])
+        self.assertIn("unknown benchmark(s): unknown", err.getvalue())
+        
+
+def suite():
+    """Get Test suite object
+    """
+    return unittest.TestLoader().loadTestsFromTestCase(BenchmarkSuiteTestCase)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run( suite() )
@@ -1,11 +1,41 @@
 # -*- coding: utf-8 -*-
 import unittest
+import os
+import asyncio
+import re
 
 from io import StringIO
+from tempfile import TemporaryDirectory
 
 from schema import Validator, node
+from schema.content_handler import ContentHandler
 from schema.mixins import children, ref
-from schema import DefaultReader
+from schema import DefaultReader, IniReader
+from schema.default_reader import completeLines
+
+class Recorder(ContentHandler):
+    """Content handler recording events along with locator positions"""
+    locator= None
+
+    def __init__(self):
+        self.record= []
+
+    def enter(self, name, **kwargs):
+        self.record.append(("enter", name, self.locator.line,
+                            self.locator.column))
+
+    def leave(self):
+        self.record.append(("leave", self.locator.line, self.locator.column))
+
+    def content(self, content):
+        self.record.append(("content", content))
+
+    def comment(self, comment):
+        self.record.append(("comment", comment))
+
+    def ignore(self, content):
+        self.record.append(("ignore", content))
+
 
 class DefaultReaderTestCase(unittest.TestCase):
 
@@ -70,6 +100,218 @@ class DefaultReaderTestCase(unittest.TestCase):
         self.assertTrue("'att2' ('attr2')" in err)        
         self.assertTrue("'att3' ('one')" in err)        
         self.assertTrue("'att4' ('two')" in err)        
+
+
+    text1= str( "value1 = 5\n"
+                "# Comment line\n"
+                "value2= 4.2 # with comment\n"
+                "# value2= 500.\n"
+                "section { value3= on \n"
+                "  value4  = 3\n"
+                "  value4\t= 4 ; value4 = 5\n"
+                "}\n" )
+
+
+    def test_parseAsync(self):
+        lines= self.text1 + "last line without newline ä"
+        expected= Recorder()
+        DefaultReader(expected).parseBuffer(lines)
+
+        async def chunks(data, size):
+            for begin in range(0, len(data), size):
+                yield data[begin:begin + size]
+
+        async def ticker(ticks):
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def parse(reader, source):
+            ticks= []
+            task= asyncio.ensure_future(ticker(ticks))
+            await reader.parseAsync(source, yieldEvery=2)
+            task.cancel()
+            return len(ticks)
+
+        for size in (1, 7, 1000):
+            result= Recorder()
+            asyncio.run(parse(DefaultReader(result), chunks(lines, size)))
+            self.assertEqual(result.record, expected.record)
+
+            # multi-byte characters split across binary chunks
+            result= Recorder()
+            ticks= asyncio.run(parse(DefaultReader(result),
+                                     chunks(lines.encode("utf-8"), size)))
+            self.assertEqual(result.record, expected.record)
+            self.assertGreater(ticks, 5)
+
+        asyncio.run(self.reader.parseAsync(chunks(self.text1, 10)))
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val4, 5)
+
+
+    def test_parseBuffer(self):
+        self.reader.parseBuffer(self.text1.encode("utf-8"))
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val2, 4.2)
+        self.assertEqual(self.val3, "on")
+        self.assertEqual(self.val4, 5)
+
+        # Identical event stream and locator positions in both modes
+        lines= self.text1 + "last line without newline"
+        expected= Recorder()
+        DefaultReader(expected).parse(StringIO(lines))
+        result= Recorder()
+        DefaultReader(result).parseBuffer(lines)
+        self.assertEqual(result.record, expected.record)
+        self.assertIn(("enter", "section", 5, 8), result.record)
+
+
+    def test_parseFile(self):
+        with TemporaryDirectory() as tmpDir:
+            path= os.path.join(tmpDir, "test.cfg")
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(self.text1)
+            
+            self.reader.parseFile(path)
+            self.assertEqual(self.val1, 5)
+            self.assertEqual(self.val2, 4.2)
+            self.assertEqual(self.val3, "on")
+            self.assertEqual(self.val4, 5)
+
+            open(path, "w").close()
+            self.reader.parseFile(path) #empty file
+            self.assertEqual(self.val1, 0)
+
+            # chunks splitting lines and multi-byte characters
+            lines= self.text1 + "äöü\r\nlast line without newline ä"
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(lines)
+
+            expected= Recorder()
+            DefaultReader(expected).parseBuffer(lines)
+
+            for chunkSize in (1, 5, 4096):
+                result= Recorder()
+                DefaultReader(result).parseFile(path, chunkSize=chunkSize)
+                self.assertEqual(result.record, expected.record)
+
+
+    def test_actionCache(self):
+        reader1= DefaultReader(ContentHandler())
+        reader2= DefaultReader(ContentHandler())
+        reader3= DefaultReader(ContentHandler(), assignChar=":")
+        reader4= IniReader(ContentHandler())
+
+        for (regex1, action1), (regex2, action2) in zip(reader1._actions,
+                                                        reader2._actions):
+            self.assertIs(regex1, regex2)
+            self.assertIsNot(action1, action2)
+            self.assertIs(action1.__self__, reader1)
+        
+        self.assertIs(reader1.scanner(), reader2.scanner())
+        self.assertIsNot(reader1.scanner(), reader3.scanner())
+        self.assertIsNot(reader1.scanner(), reader4.scanner())
+        self.assertEqual(len(reader4._actions), 8)
+
+
+    def test_reset(self):
+        self.reader.startDocument()
+        self.reader.tokenize(["section [first= 1, second= "])
+        self.assertTrue(self.reader._inAttributes)
+        self.assertFalse(self.reader._onLhs)
+        self.reader.reset()
+        self.assertFalse(self.reader._inAttributes)
+        self.assertTrue(self.reader._onLhs)
+        self.assertEqual(self.reader._stack, [])
+        self.assertEqual(self.reader._attributes, {})
+
+        self.reader.parse(StringIO(self.text1))
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val4, 5)
+
+
+    def test_iterParse(self):
+        # the second document contains an unmatched stray carriage return
+        streams= [StringIO("value1= {0}\nvalue2= {0}.5\n{1}".format(i,
+                                                         "\r\r\n" * (i == 1)))
+                  for i in range(3)]
+        documents= self.reader.iterParse(streams)
+        self.assertEqual(self.val1, 0) #nothing parsed before iteration
+        values= [(self.val1, self.val2, self.reader.nErrors)
+                 for stream in documents]
+        self.assertEqual(values, [(0, 0.5, 0), (1, 1.5, 1), (2, 2.5, 0)])
+
+
+    def test_customAction(self):
+        # stray carriage returns are not matched by any default pattern
+        self.reader.actions([(r"\r", "ignore")])
+        text=StringIO( "value1 = 5\r\r\n"
+                       "value2= 4.2\n" )
+
+        self.reader.parse(text)
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val2, 4.2)
+        self.assertEqual(self.reader.nErrors, 0)
+        self.assertIn("(?P<_15>\\r)", self.reader.scanner().pattern)
+
+
+    def test_actionFlags(self):
+        # flags apply to the respective pattern only
+        self.reader.actions([(r"(?i)\r", "ignore"),
+                             (re.compile(r"\r", re.DOTALL), "ignore")])
+        self.assertIn("(?P<_15>(?i:\\r))", self.reader.scanner().pattern)
+        self.assertIn("(?P<_16>(?s:\\r))", self.reader.scanner().pattern)
+
+        self.reader.parse(StringIO("value1 = 5\r\r\nvalue2= 4.2\n"))
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.reader.nErrors, 0)
+
+        self.reader.actions([(r"(?P<cr>\r)", "ignore")])
+
+        with self.assertRaises(ValueError):
+            self.reader.actions([(r"(?P<cr>\r\r)", "ignore")])
+
+        with self.assertRaises(ValueError):
+            self.reader.actions([(r"(?P<_1>\r\r)", "ignore")])
+
+
+    def test_longLine(self):
+        class Line(str):
+            """Line refusing to be sliced"""
+            def __getitem__(self, key):
+                raise AssertionError("Line sliced at {0}".format(key))
+
+        # Tokens are matched in place, so parse time grows linearly with the
+        # length of a line. Refer to benchmark defaultReaderLongLine.
+        text= "values= {0}\n".format(", ".join(["12345"] * 100))
+        recorder= Recorder()
+        DefaultReader(recorder).parse([Line(text)])
+        self.assertEqual(recorder.record.count(("content", "12345")), 100)
+
+        # Parts of a line spanning many chunks are joined once
+        chunks= [text[begin:begin + 7] for begin in range(0, len(text), 7)]
+        parts= []
+        for chunk in chunks[:-1]:
+            self.assertEqual(completeLines(parts, chunk), (chunk, 0))
+        self.assertEqual(completeLines(parts, chunks[-1]),
+                         (text, len(text)))
+        self.assertEqual(parts, [])
+
+        async def source():
+            for chunk in chunks:
+                yield chunk
+
+        result= Recorder()
+        reader= DefaultReader(result)
+        reader.startDocument()
+        reader.tokenizeChunks(chunks)
+        reader.endDocument()
+        self.assertEqual(result.record, recorder.record)
+
+        result= Recorder()
+        asyncio.run(DefaultReader(result).parseAsync(source()))
+        self.assertEqual(result.record, recorder.record)
         
 
 def suite():
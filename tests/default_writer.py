@@ -137,6 +137,36 @@ class DefaultWriterTestCase(unittest.TestCase):
         self.assertEqual(self.err.getvalue(), "")
 
 
+    def test_buffer(self):
+        text= "".join("value{0} = {0}\n".format(i) for i in range(100))
+        expected= StringIO()
+        DefaultReader(DefaultWriter(os=expected, bufferSize=1)).parse(
+                                                               StringIO(text))
+
+        writer= DefaultWriter(os=self.out, bufferSize=10)
+        writer.open()
+        writer.enter("root")
+        writer.enter("value1")
+        writer.content("1")
+        writer.leave()
+        self.assertEqual("", self.out.getvalue())
+        writer.flush()
+        self.assertEqual("root {\n  value1= 1\n", self.out.getvalue())
+
+        for bufferSize in (1, 10, 4096):
+            out= StringIO()
+            DefaultReader(DefaultWriter(os=out, bufferSize=bufferSize)).parse(
+                                                               StringIO(text))
+            self.assertEqual(expected.getvalue(), out.getvalue())
+
+
+    def test_leafAttributes(self):
+        DefaultReader(self.handler1).parse(
+                                      StringIO("value1 [b='x y', a=1] = 5\n"))
+        self.assertEqual(self.out.getvalue(),
+                         "root {\n  value1[a=\"1\", b=\"x y\"]= 5\n}\n")
+
+
 def suite():
     """Get Test suite object
     """
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from io import StringIO
+
+from schema import Validator, EventBatch, DefaultReader, DefaultWriter, \
+                   SchemaError, node
+from schema.mixins import children, ref, lst
+from schema.content_handler import ContentHandler, ENTER, LEAVE, CONTENT, \
+                                   COMMENT, IGNORE
+
+
+class Recorder(ContentHandler):
+    """Content handler recording all events"""
+    def __init__(self):
+        self.record= []
+
+    def enter(self, name, **kwargs):
+        self.record.append(("enter", name, kwargs))
+
+    def leave(self):
+        self.record.append(("leave",))
+
+    def content(self, content):
+        self.record.append(("content", content))
+
+    def comment(self, comment):
+        self.record.append(("comment", comment))
+
+    def ignore(self, content):
+        self.record.append(("ignore", content))
+
+
+class EventBatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.val1 = 0
+        self.val2 = 0.
+        self.val3 = None
+        self.val4 = []
+
+        self.context= node("root") << children()[
+                        node("value1") << ref(self, "val1", int),
+                        node("value2") << ref(self, "val2", float),
+                        node("section") << children() [
+                          node("value3") << ref(self, "val3"),
+                          node("value4") << lst(self, "val4", int)
+                        ]
+                      ]
+        self.text= str( "value1 = 5\n"
+                        "# Comment line\n"
+                        "value2= 4.2 # with comment\n"
+                        "section [first= 1] { value3= on \n"
+                        "  value4  = 3\n"
+                        "  value4\t= 4 ; value4 = 5\n"
+                        "}\n" )
+
+
+    def test_replay(self):
+        handler= Recorder()
+        handler.events([(ENTER, ("root", {"a": "1"})),
+                        (IGNORE, " "),
+                        (CONTENT, "x"),
+                        (COMMENT, "y"),
+                        (LEAVE, None)])
+        self.assertEqual(handler.record, [("enter", "root", {"a": "1"}),
+                                          ("ignore", " "),
+                                          ("content", "x"),
+                                          ("comment", "y"),
+                                          ("leave",)])
+        with self.assertRaises(ValueError):
+            handler.events([(0, None)])
+
+
+    def test_batchSize(self):
+        batches= []
+        
+        class Handler(ContentHandler):
+            def events(self, batch):
+                batches.append(list(batch))
+                
+        batch= EventBatch(Handler(), size=3)
+        batch.open()
+        batch.enter("root")
+        batch.ignore("")
+        batch.content("")
+        batch.enter("value")
+        batch.content("1")
+        batch.leave()
+        self.assertEqual(len(batches), 1)
+        batch.leave()
+        self.assertEqual(len(batches), 1)
+        batch.close()
+        self.assertEqual(batches, [[(ENTER, ("root", {})),
+                                    (ENTER, ("value", {})),
+                                    (CONTENT, "1"),
+                                    (LEAVE, None)],
+                                   [(LEAVE, None)]])
+
+
+    def test_validator(self):
+        for compiled in (False, True):
+            for batchSize in (None, 4):
+                self.val4= []
+                reader= DefaultReader(Validator(self.context,
+                                                compiled=compiled),
+                                      batchSize=batchSize)
+                reader.parse(StringIO(self.text))
+                self.assertEqual(self.val1, 5)
+                self.assertEqual(self.val2, 4.2)
+                self.assertEqual(self.val3, "on")
+                self.assertEqual(self.val4, [3, 4, 5])
+
+                with self.assertRaises(SchemaError) as env:
+                    reader.parse(StringIO(self.text.replace("4.2", "x")))
+                self.assertEqual(env.exception.line, 3)
+
+
+    def test_writer(self):
+        expected= StringIO()
+        DefaultReader(DefaultWriter(os=expected)).parse(StringIO(self.text))
+        result= StringIO()
+        reader= DefaultReader(DefaultWriter(os=result), batchSize=4)
+        reader.parse(StringIO(self.text))
+        self.assertEqual(result.getvalue(), expected.getvalue())
+
+
+def suite():
+    """Get Test suite object
+    """
+    return unittest.TestLoader().loadTestsFromTestCase(EventBatchTestCase)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run( suite() )
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+import unittest
+import os
+
+from io import StringIO
+from tempfile import TemporaryDirectory
+
+from schema import Validator, EventCache, DefaultReader, DefaultWriter, \
+                   IniReader, SchemaError, Schema, node
+from schema.mixins import children, ref, lst
+from schema.content_handler import ENTER, LEAVE, CONTENT
+from schema.event_cache import EventRecorder
+from schema.schema_reader import SchemaReader
+
+
+class EventCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.val1 = 0
+        self.val2 = 0.
+        self.val3 = None
+        self.val4 = []
+
+        self.context= node("root") << children()[
+                        node("value1") << ref(self, "val1", int),
+                        node("value2") << ref(self, "val2", float),
+                        node("section") << children() [
+                          node("value3") << ref(self, "val3"),
+                          node("value4") << lst(self, "val4", int)
+                        ]
+                      ]
+        self.validator= Validator(self.context)
+        self.tmpDir= TemporaryDirectory()
+        self.cache= EventCache(os.path.join(self.tmpDir.name, "cache"))
+        self.path= os.path.join(self.tmpDir.name, "test.cfg")
+        self.text= str( "value1 = 5\n"
+                        "# Comment line\n"
+                        "value2= 4.2 # with comment\n"
+                        "section [first= 1] { value3= on \n"
+                        "  value4  = 3\n"
+                        "  value4\t= 4 ; value4 = 5\n"
+                        "}\n" )
+
+        with open(self.path, "w") as f:
+            f.write(self.text)
+
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+
+    def checkValues(self):
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val2, 4.2)
+        self.assertEqual(self.val3, "on")
+        self.assertEqual(self.val4, [3, 4, 5])
+
+
+    def test_validator(self):
+        self.assertFalse(self.cache.parseFile(self.path, self.validator))
+        self.checkValues()
+        self.assertTrue(os.path.exists(self.cache.cacheFile(self.path)))
+
+        self.val4= []
+        self.assertTrue(self.cache.parseFile(self.path, self.validator))
+        self.checkValues()
+
+
+    def test_writer(self):
+        expected= StringIO()
+        DefaultReader(DefaultWriter(os=expected)).parse(StringIO(self.text))
+
+        for hit in (False, True):
+            result= StringIO()
+            self.assertEqual(self.cache.parseFile(self.path,
+                                                  DefaultWriter(os=result)),
+                             hit)
+            self.assertEqual(result.getvalue(), expected.getvalue())
+
+
+    def test_invalidate(self):
+        self.cache.parseFile(self.path, self.validator)
+
+        with open(self.path, "w") as f:
+            f.write("value1 = 6\n")
+
+        self.assertFalse(self.cache.parseFile(self.path, self.validator))
+        self.assertEqual(self.val1, 6)
+
+        # Different reader yields different cache entry
+        cache= EventCache(self.cache.directory, reader=IniReader)
+        self.assertNotEqual(cache.cacheFile(self.path),
+                            self.cache.cacheFile(self.path))
+
+
+    def test_stat(self):
+        self.cache.parseFile(self.path, self.validator)
+        stat= os.stat(self.path)
+
+        # same modification time and size: file is not read
+        with open(self.path, "w") as f:
+            f.write(self.text.replace("value1 = 5", "value1 = 6"))
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertTrue(self.cache.parseFile(self.path, self.validator))
+        self.assertEqual(self.val1, 5)
+
+        # touched file with unchanged content is confirmed by its hash
+        with open(self.path, "w") as f:
+            f.write(self.text)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertTrue(self.cache.parseFile(self.path, self.validator))
+        self.assertEqual(self.cache._header(self.cache.cacheFile(self.path))[0],
+                         stat.st_mtime_ns + 10**9)
+        self.checkValues()
+
+
+    def test_locator(self):
+        self.cache.parseFile(self.path, self.validator)
+        context= node("root") << children()[
+                   node("value1") << ref(self, "val1", int),
+                   node("value2") << ref(self, "val2", float)
+                 ]
+
+        with self.assertRaises(SchemaError) as env:
+            self.cache.parseFile(self.path, Validator(context))
+        
+        self.assertEqual(env.exception.line, 4)
+
+
+    def test_batched(self):
+        # batches produced by the reader are recorded and forwarded
+        cache= EventCache(self.cache.directory, batchSize=4)
+
+        for hit in (False, True):
+            self.val4= []
+            self.assertEqual(cache.parseFile(self.path, self.validator), hit)
+            self.checkValues()
+
+        recorder= EventRecorder()
+        SchemaReader(recorder, batchSize=4)(Schema(self.context))
+        self.assertEqual(recorder.recorded[0], (ENTER, ("root", {}), 0, 0))
+        self.assertIn((CONTENT, "4.2", 0, 0), recorder.recorded)
+        self.assertEqual(recorder.recorded[-1], (LEAVE, None, 0, 0))
+
+
+def suite():
+    """Get Test suite object
+    """
+    return unittest.TestLoader().loadTestsFromTestCase(EventCacheTestCase)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run( suite() )
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from schema import IncrementalValidator, DefaultReader, SchemaError, node
+from schema.mixins import children, ref, lst, proxy
+
+
+class IncrementalValidatorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.converted= []
+        self.val1 = 0
+        self.val2 = 0.
+        self.val3 = ""
+        self.val4 = []
+        self.val5 = 0
+
+        self.context= node("root") << children()[
+                        node("value1") << ref(self, "val1", self.int),
+                        node("value2") << ref(self, "val2", float),
+                        node("section") << children() [
+                          node("value3") << ref(self, "val3"),
+                          node("value4") << lst(self, "val4", self.int)
+                        ],
+                        node("item") << proxy(key="id") [
+                          node("first") << ref(self, "val5", self.int)
+                        ]
+                      ]
+        self.validator= IncrementalValidator(self.context)
+        self.reader= DefaultReader(self.validator)
+
+
+    def int(self, string=None):
+        """Convert string to int and record conversion"""
+        if string is None:
+            return 0
+        self.converted.append(string)
+        return int(string)
+
+
+    text1= str( "value1 = 5\n"
+                "value2= 4.2\n"
+                "section { value3= on \n"
+                "  value4  = 3\n"
+                "  value4\t= 4\n"
+                "}\n"
+                "item [id=first] = 7\n")
+
+
+    def test_unchanged(self):
+        self.assertFalse(self.validator.incremental)
+        self.reader.parseBuffer(self.text1)
+        self.assertTrue(self.validator.incremental)
+        self.assertEqual(["5", "3", "4", "7"], self.converted)
+        self.assertEqual([3, 4], self.val4)
+
+        self.converted.clear()
+        self.reader.parseBuffer(self.text1)
+        self.assertEqual([], self.converted)
+        self.assertEqual(5, self.val1)
+        self.assertEqual([3, 4], self.val4)
+        self.assertEqual(7, self.val5)
+
+
+    def test_changed(self):
+        self.reader.parseBuffer(self.text1)
+        self.converted.clear()
+
+        self.reader.parseBuffer(self.text1.replace("value1 = 5", "value1= 6")
+                                          .replace("= 4\n", "= 8\n"))
+        self.assertEqual(["6", "3", "8"], self.converted)
+        self.assertEqual(6, self.val1)
+        self.assertEqual(4.2, self.val2)
+        self.assertEqual("on", self.val3)
+        self.assertEqual([3, 8], self.val4)
+
+
+    def test_removed(self):
+        self.reader.parseBuffer(self.text1)
+        self.converted.clear()
+
+        self.reader.parseBuffer("value2= 4.2\nitem [id=first] = 7\n")
+        self.assertEqual([], self.converted)
+        self.assertEqual(0, self.val1)
+        self.assertEqual(4.2, self.val2)
+        self.assertEqual("", self.val3)
+        self.assertEqual([], self.val4)
+        self.assertEqual(7, self.val5)
+
+        self.reader.parseBuffer(self.text1)
+        self.assertEqual(["5", "3", "4"], self.converted)
+        self.assertEqual("on", self.val3)
+
+
+    def test_error(self):
+        self.reader.parseBuffer(self.text1)
+
+        with self.assertRaises(SchemaError) as cm:
+            self.reader.parseBuffer(self.text1 + "value666= 1\n")
+        self.assertIn("value666", str(cm.exception))
+        self.assertFalse(self.validator.incremental)
+
+        self.converted.clear()
+        self.reader.parseBuffer(self.text1)
+        self.assertEqual(["5", "3", "4", "7"], self.converted)
+
+        self.validator.clear()
+        self.assertFalse(self.validator.incremental)
+
+
+    def test_compiled(self):
+        validator= IncrementalValidator(self.context, compiled=True)
+        reader= DefaultReader(validator)
+        reader.parseBuffer(self.text1)
+        self.assertEqual(["5", "3", "4", "7"], self.converted)
+
+        self.converted.clear()
+        reader.parseBuffer(self.text1)
+        self.assertEqual([], self.converted)
+        self.assertEqual(5, self.val1)
+        self.assertEqual([3, 4], self.val4)
+
+        reader.parseBuffer(self.text1.replace("value1 = 5", "value1= 6"))
+        self.assertEqual(["6"], self.converted)
+        self.assertEqual(6, self.val1)
+        self.assertEqual([3, 4], self.val4)
+        self.assertEqual(7, self.val5)
+
+
+
+def suite():
+    """Get Test suite object
+    """
+    return unittest.TestLoader().loadTestsFromTestCase(
+                                                 IncrementalValidatorTestCase)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run( suite() )
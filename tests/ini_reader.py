@@ -1,10 +1,25 @@
 # -*- coding: utf-8 -*-
 import unittest
+import asyncio
 from io import StringIO
 
 from schema import node, Bool, Validator
 from schema.mixins import ref, children, lst
 from schema import IniReader
+from schema.content_handler import ContentHandler
+
+
+class CallCounter(ContentHandler):
+    """Content handler counting invocations of ignore and comment"""
+    def __init__(self):
+        self.nIgnore = 0
+        self.nComment= 0
+
+    def ignore(self, content):
+        self.nIgnore+= 1
+
+    def comment(self, comment):
+        self.nComment+= 1
 
 
 class IniReaderTestCase(unittest.TestCase):
@@ -50,6 +65,60 @@ class IniReaderTestCase(unittest.TestCase):
         self.assertEqual(self.err.getvalue(), "")
 
 
+    text1= str( "value1 = 5\n"
+                "value2= 4.2\n"
+                "\n"
+                " [section] "
+                "  value3= on \n"
+                "  value4  = 3\n"
+                "  value4\t= 4 \n"
+                "  value4 = 5\n"
+                "\n" )
+
+
+    def test_parseBuffer(self):
+        self.reader.parseBuffer(self.text1.encode("utf-8"))
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val2, 4.2)
+        self.assertEqual(self.val3, True)
+        self.assertEqual(self.val4, [3, 4, 5])
+
+
+    def test_parseAsync(self):
+        async def lines(text):
+            for line in text.splitlines(True):
+                yield line
+
+        asyncio.run(self.reader.parseAsync(lines(self.text1)))
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val2, 4.2)
+        self.assertEqual(self.val3, True)
+        self.assertEqual(self.val4, [3, 4, 5])
+
+
+    def test_skipIgnorable(self):
+        # whitespace heavy input
+        text= "".join(["  [ section{0} ]  \n".format(i)
+                       + "    key   =   value  ; comment\n" * 10
+                       for i in range(100)])
+
+        handler= CallCounter()
+        IniReader(handler).parseBuffer(text)
+        self.assertEqual(handler.nIgnore, 100 * 4 + 1000 * 3)
+        self.assertEqual(handler.nComment, 1000)
+
+        handler= CallCounter()
+        handler.wantsIgnorable= False
+        handler.wantsComments= False
+        IniReader(handler).parseBuffer(text)
+        self.assertEqual(handler.nIgnore, 0)
+        self.assertEqual(handler.nComment, 0)
+
+        self.assertFalse(self.validator.wantsIgnorable)
+        self.reader.parseBuffer(" [section] ; comment\n  value3 = on \n")
+        self.assertEqual(self.val3, True)
+
+
 def suite():
     """Get Test suite object
     """
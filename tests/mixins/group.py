@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 import unittest
 
-from schema.mixins import Group, children
-from schema import node
+from schema.mixins import Group, children, ref
+from schema import node, Context
 
 
 class GroupTestCase(unittest.TestCase):
@@ -63,6 +63,17 @@ class GroupTestCase(unittest.TestCase):
         self.assertIsNone(self.group.parent)
         self.assertEqual("one", self.group.one.name)
         self.assertEqual("four", self.group.three.four.name)
+
+
+    def test_composedType(self):
+        self.assertIs(type(self.group), type(self.group.three))
+        self.assertIs(type(self.group), type(node("other") << children()))
+        self.assertEqual(type(self.group).__qualname__, "GroupContext")
+        self.assertEqual(type(self.group).__bases__, (Group, Context))
+
+        value= node("value") << ref(self, "value")
+        self.assertEqual(type(value).__qualname__, "ValueContext")
+        self.assertIsNot(type(value), type(self.group))
                 
 
 def suite():
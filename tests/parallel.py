@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+import unittest
+import os
+
+from tempfile import TemporaryDirectory
+
+from schema import node, IniReader, SchemaError
+from schema.mixins import children, ref, lst
+from schema.parallel import load, loadMany
+
+
+class Config(object):
+    """Target object populated by the data model"""
+    def __init__(self):
+        self.val1= 0
+        self.val2= 0.
+        self.val3= []
+
+
+def createSchema():
+    """Data model factory"""
+    cfg= Config()
+    context= node("root") << children()[
+                node("value1") << ref(cfg, "val1", int),
+                node("value2") << ref(cfg, "val2", float),
+                node("section") << children() [
+                  node("value3") << lst(cfg, "val3", int)
+                ]
+             ]
+    return context, cfg
+
+
+class ParallelTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpDir= TemporaryDirectory()
+        self.paths= []
+
+        for i in range(4):
+            path= os.path.join(self.tmpDir.name, "{0:d}.cfg".format(i))
+            with open(path, "w") as f:
+                f.write("value1= {0:d}\n"
+                        "value2= {0:d}.5\n"
+                        "section {{\n"
+                        "  value3= 1\n"
+                        "  value3= {0:d}\n"
+                        "}}\n".format(i))
+            self.paths.append(path)
+
+        self.invalid= os.path.join(self.tmpDir.name, "invalid.cfg")
+        with open(self.invalid, "w") as f:
+            f.write("value1= 1\n"
+                    "value2= abc\n")
+
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+
+    def check(self, results):
+        self.assertEqual(len(results), len(self.paths) + 1)
+
+        for i, (cfg, error) in enumerate(results[:-1]):
+            self.assertIsNone(error)
+            self.assertEqual(cfg.val1, i)
+            self.assertEqual(cfg.val2, i + 0.5)
+            self.assertEqual(cfg.val3, [1, i])
+
+        cfg, error= results[-1]
+        self.assertEqual(cfg.val1, 1)
+        self.assertIsInstance(error, SchemaError)
+        self.assertEqual(error.line, 2)
+
+
+    def test_load(self):
+        cfg, error= load(self.paths[1], createSchema)
+        self.assertIsNone(error)
+        self.assertEqual(cfg.val3, [1, 1])
+
+        cfg, error= load(self.invalid, createSchema, reader=IniReader)
+        self.assertIsInstance(error, SchemaError)
+        self.assertIn("could not convert string to float", error.message)
+
+
+    def test_incomplete(self):
+        truncated= os.path.join(self.tmpDir.name, "truncated.cfg")
+        with open(truncated, "w") as f:
+            f.write("value2= 1.5\n"
+                    "section {\n"
+                    "  value3= 1\n")
+        unmatched= os.path.join(self.tmpDir.name, "unmatched.cfg")
+        with open(unmatched, "w") as f:
+            f.write("value1= 1\r\r\n")
+
+        for workers in (1, 2):
+            results= loadMany([truncated, unmatched, self.paths[0]],
+                              createSchema, workers=workers)
+            self.assertIsInstance(results[0][1], SchemaError)
+            self.assertIn("1 warning(s)", results[0][1].message)
+            self.assertIsInstance(results[1][1], SchemaError)
+            self.assertIn("1 error(s)", results[1][1].message)
+            self.assertIsNone(results[2][1])
+
+
+    def test_unreadable(self):
+        undecodable= os.path.join(self.tmpDir.name, "undecodable.cfg")
+        with open(undecodable, "wb") as f:
+            f.write(b"value1= \xff\n")
+        missing= os.path.join(self.tmpDir.name, "missing.cfg")
+
+        for workers in (1, 2):
+            results= loadMany([undecodable, self.paths[2], missing],
+                              createSchema, workers=workers)
+            self.assertIsInstance(results[0][1], UnicodeDecodeError)
+            self.assertIsNone(results[1][1])
+            self.assertEqual(results[1][0].val1, 2)
+            self.assertIsInstance(results[2][1], FileNotFoundError)
+
+
+    def test_serial(self):
+        self.check(loadMany(self.paths + [self.invalid], createSchema,
+                            workers=1))
+
+
+    def test_parallel(self):
+        self.check(loadMany(self.paths + [self.invalid], createSchema,
+                            workers=2))
+
+
+def suite():
+    """Get Test suite object
+    """
+    return unittest.TestLoader().loadTestsFromTestCase(ParallelTestCase)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run( suite() )
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from io import StringIO
+
+from schema import Validator, DefaultReader, Profiler, \
+                   ProfilingContentHandler, node
+from schema.mixins import children, ref, lst
+
+
+class ProfilerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.val1 = 0
+        self.val2 = 0.
+        self.val3 = None
+        self.val4 = []
+
+        self.context= node("root") << children()[
+                        node("value1") << ref(self, "val1", int),
+                        node("value2") << ref(self, "val2", float),
+                        node("section") << children() [
+                          node("value3") << ref(self, "val3"),
+                          node("value4") << lst(self, "val4", int)
+                        ]
+                      ]
+        self.text= str( "value1 = 5\n"
+                        "value2= 4.2 # with comment\n"
+                        "section { value3= on \n"
+                        "  value4  = 3\n"
+                        "  value4\t= 4 ; value4 = 5\n"
+                        "}\n" )
+
+
+    def test_disabled(self):
+        validator= Validator(self.context)
+        self.assertNotIn("flushBuffer", vars(validator))
+
+
+    def test_profile(self):
+        profiler= Profiler()
+        handler= ProfilingContentHandler(Validator(self.context,
+                                                   profiler=profiler),
+                                         profiler)
+        DefaultReader(handler).parse(StringIO(self.text))
+        self.assertEqual(self.val4, [3, 4, 5])
+
+        stats= profiler.asDict()
+        self.assertEqual(stats["root/section/value4"]["enter"]["count"], 3)
+        self.assertEqual(stats["root/section/value4"]["leave"]["count"], 3)
+        self.assertEqual(stats["root/section/value4"]["convert"]["count"], 3)
+        self.assertEqual(stats["root/value1"]["convert"]["count"], 1)
+        self.assertGreater(stats["root/value1"]["leave"]["time"], 0.)
+
+        folded= list(profiler.folded())
+        self.assertIn("root;section;value4", [l.split()[0] for l in folded])
+        self.assertIn("root;section;value4;[convert]",
+                      [l.split()[0] for l in folded])
+        for line in folded:
+            self.assertGreaterEqual(int(line.split()[1]), 0)
+
+        profiler.clear()
+        self.assertEqual(len(profiler), 0)
+
+
+def suite():
+    """Get Test suite object
+    """
+    return unittest.TestLoader().loadTestsFromTestCase(ProfilerTestCase)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run( suite() )
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+import unittest
+import os
+
+from tempfile import TemporaryDirectory
+from threading import Event
+from time import sleep
+
+from schema import node, SchemaError
+from schema.mixins import children, ref
+from schema.reload import Watcher
+
+
+class Config(object):
+    """Target object populated by the data model"""
+    def __init__(self):
+        self.val1= 0
+        self.val2= 0.
+        self.val3= 0
+
+
+def createSchema():
+    """Data model factory"""
+    cfg= Config()
+    context= node("root") << children()[
+                node("value1") << ref(cfg, "val1", int),
+                node("value2") << ref(cfg, "val2", float),
+                node("section") << children()[
+                  node("value3") << ref(cfg, "val3", int)
+                ]
+             ]
+    return context, cfg
+
+
+class WatcherTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpDir= TemporaryDirectory()
+        self.path= os.path.join(self.tmpDir.name, "test.cfg")
+        self.mtime= 1000000000 * 10**9
+        self.write(1, "2.5")
+
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+
+    def write(self, val1, val2):
+        """Write configuration file with distinct modification time"""
+        self.writeBytes("value1= {}\nvalue2= {}\n".format(val1, val2)
+                        .encode("utf-8"))
+
+
+    def writeBytes(self, data):
+        """Write raw content with distinct modification time"""
+        with open(self.path, "wb") as f:
+            f.write(data)
+        self.mtime+= 10**9
+        os.utime(self.path, ns=(self.mtime, self.mtime))
+
+
+    def test_poll(self):
+        watcher= Watcher(self.path, createSchema, delay=0.)
+        self.assertEqual([self.path], watcher.poll())
+        cfg= watcher[self.path]
+        self.assertEqual(1, cfg.val1)
+        self.assertEqual([], watcher.poll())
+
+        #modification is debounced until it is stable for two polls
+        self.write(2, "3.5")
+        self.assertEqual([], watcher.poll())
+        self.write(3, "4.5")
+        self.assertEqual([], watcher.poll())
+        self.assertIs(cfg, watcher[self.path])
+        self.assertEqual([self.path], watcher.poll())
+        self.assertEqual(3, watcher[self.path].val1)
+        self.assertEqual(1, cfg.val1)
+
+
+    def test_error(self):
+        errors= []
+        watcher= Watcher([self.path], createSchema, delay=0.,
+                         onError=lambda path, ex: errors.append(ex))
+        watcher.poll()
+        cfg= watcher[self.path]
+
+        self.write(5, "abc")
+        watcher.poll()
+        self.assertEqual([], watcher.poll())
+        self.assertIs(cfg, watcher[self.path])
+        self.assertIsInstance(watcher.errors[self.path], SchemaError)
+        self.assertEqual(1, len(errors))
+
+        #failed content is not reloaded again
+        self.assertEqual([], watcher.poll())
+        self.assertEqual(1, len(errors))
+
+        self.write(6, "1.5")
+        watcher.poll()
+        self.assertEqual([self.path], watcher.poll())
+        self.assertEqual({}, watcher.errors)
+
+
+    def test_truncated(self):
+        watcher= Watcher(self.path, createSchema, delay=0.)
+        watcher.poll()
+        cfg= watcher[self.path]
+
+        self.writeBytes(b"value1= 3\nsection {\n  value3= 1\n")
+        watcher.poll()
+        self.assertEqual([], watcher.poll())
+        self.assertIs(cfg, watcher[self.path])
+        self.assertIsInstance(watcher.errors[self.path], SchemaError)
+
+
+    def test_recent(self):
+        #file modified just now may still be written
+        path= os.path.join(self.tmpDir.name, "recent.cfg")
+        with open(path, "w") as f:
+            f.write("value1= 2\n")
+
+        watcher= Watcher(path, createSchema, delay=0.1)
+        self.assertEqual([], watcher.poll())
+        sleep(0.2)
+        self.assertEqual([path], watcher.poll())
+        self.assertEqual(2, watcher[path].val1)
+
+
+    def test_callbacks(self):
+        calls= []
+
+        def onReload(path, cfg):
+            calls.append(watcher.poll()) #must not deadlock
+            raise RuntimeError("callback failed")
+
+        watcher= Watcher(self.path, createSchema, delay=0., onReload=onReload)
+        self.assertEqual([self.path], watcher.poll())
+        self.assertEqual([[]], calls)
+        self.assertEqual(1, watcher.nErrors)
+
+        reloaded= Event()
+        watcher.onReload= lambda path, cfg: (reloaded.set(), 1 / 0)
+        watcher.interval= 0.01
+
+        with watcher:
+            self.write(4, "2.5")
+            self.assertTrue(reloaded.wait(5.))
+            reloaded.clear()
+            self.write(5, "2.5")
+            self.assertTrue(reloaded.wait(5.))
+            self.assertTrue(watcher.isRunning)
+
+        self.assertEqual(5, watcher[self.path].val1)
+
+
+    def test_thread(self):
+        reloaded= Event()
+        watcher= Watcher(self.path, createSchema, interval=0.01, delay=0.,
+                         onReload=lambda path, cfg: reloaded.set())
+
+        with watcher:
+            self.assertTrue(watcher.isRunning)
+            self.assertEqual(1, watcher[self.path].val1)
+            reloaded.clear()
+            self.write(7, "2.5")
+            self.assertTrue(reloaded.wait(5.))
+            self.assertEqual(7, watcher[self.path].val1)
+
+        self.assertFalse(watcher.isRunning)
+
+
+    def test_threadError(self):
+        failing= []
+
+        def factory():
+            if failing:
+                raise RuntimeError("factory failed")
+            return createSchema()
+
+        reloaded= Event()
+        failed= Event()
+        watcher= Watcher(self.path, factory, interval=0.01, delay=0.,
+                         onReload=lambda path, cfg: reloaded.set(),
+                         onError=lambda path, ex: failed.set())
+
+        with watcher:
+            self.writeBytes(b"value1= \xff\n")
+            self.assertTrue(failed.wait(5.))
+            self.assertIsInstance(watcher.errors[self.path],
+                                  UnicodeDecodeError)
+
+            failed.clear()
+            failing.append(True)
+            self.write(8, "2.5")
+            self.assertTrue(failed.wait(5.))
+            self.assertIsInstance(watcher.errors[self.path], RuntimeError)
+            self.assertTrue(watcher.isRunning)
+
+            reloaded.clear()
+            failing.clear()
+            self.write(9, "1.5")
+            self.assertTrue(reloaded.wait(5.))
+            self.assertEqual(9, watcher[self.path].val1)
+            self.assertEqual({}, watcher.errors)
+
+
+def suite():
+    """Get Test suite object
+    """
+    return unittest.TestLoader().loadTestsFromTestCase(WatcherTestCase)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run( suite() )
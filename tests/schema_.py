@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 #NOTE File has to be named schema_ to avoid name conflict with package schema
 import unittest
-from schema import Schema, node
-from schema.mixins import children, ref
+from types import SimpleNamespace
+from schema import Schema, CompiledSchema, Validator, SchemaError, Profiler, \
+                   node
+from schema.mixins import children, ref, proxy
+from schema.content_handler import ENTER
 
 
 class SchemaTestCase(unittest.TestCase):
@@ -90,6 +93,56 @@ class SchemaTestCase(unittest.TestCase):
         
 
 
+    def test_walk(self):
+        self.assertEqual([(d, c.name) for d, c in self.schema.walk()],
+                         [(0, "root"), (1, "value1"), (1, "value2"),
+                          (1, "section"), (2, "value3"), (2, "value4")])
+        
+        self.schema.enter("root")
+        self.schema.enter("section")
+        self.assertEqual([(d, c.name) for d, c in self.schema.walk()],
+                         [(0, "section"), (1, "value3"), (1, "value4")])
+        self.assertEqual(3, len(list(self.schema.walk(self.context.section))))
+        
+        with self.assertRaises(RuntimeError):
+            list(Schema().walk())
+
+
+    def test_walkDeep(self):
+        depth= 5000
+        root= node("n0") << children()
+        ctx= root
+        for i in range(1, depth):
+            child= node("n{}".format(i)) << children()
+            ctx.insert(child)
+            ctx= child
+        
+        self.assertEqual(list(range(depth)),
+                         [d for d, c in Schema(root).walk()])
+
+
+    def test_lookup(self):
+        self.assertIs(self.context, self.schema.lookup(""))
+        self.assertIs(self.context.section.value3,
+                      self.schema.lookup("section/value3"))
+        self.assertEqual(["value1", "value2", "section", "section/value3",
+                          "section/value4"], list(self.schema.paths()))
+        self.assertIs(self.schema.pathIndex(), self.schema.pathIndex())
+        
+        self.assertRaises(ValueError, self.schema.lookup, "section/value5")
+        
+        self.context.section.insert(node("value5") << ref(self, "val5"))
+        self.assertIs(self.context.section.value5,
+                      self.schema.lookup("section/value5"))
+        
+        self.context.section[node("value6")]
+        self.assertEqual(["value1", "value2", "section", "section/value6"],
+                         list(self.schema.paths()))
+
+        with self.assertRaises(RuntimeError):
+            Schema().lookup("value1")
+
+
     def test_assign(self):
         self.schema.enter("root")
         self.schema.enter("value1")
@@ -100,10 +153,152 @@ class SchemaTestCase(unittest.TestCase):
         self.assertEqual(42, self.val1)
         
 
+class CompiledSchemaTestCase(SchemaTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.schema= self.schema.compile()
+
+
+    def test_compile(self):
+        self.assertIsInstance(self.schema, CompiledSchema)
+        self.assertIs(self.schema, self.schema.compile())
+        self.assertEqual(6, len(list(self.schema.states())))
+
+        states= {ctx.name: state for state, ctx in self.schema.states()}
+        self.assertEqual(states["value3"],
+                         self.schema.transitions[(states["section"],
+                                                  "value3")])
+        
+        with self.assertRaises(RuntimeError):
+            Schema().compile()
+
+
+    def test_proxy(self):
+        context= node("root") << children()[
+                    node("item") << proxy(key="id")[
+                        node("first") << ref(self, "val1", int),
+                        node("second") << children()[
+                            node("value") << ref(self, "val2", float)
+                        ]
+                    ]
+                 ]
+        validator= Validator(context, compiled=True)
+        validator.open()
+        validator.enter("root")
+        validator.enter("item", id="first")
+        validator.content("1")
+        validator.leave()
+        validator.enter("item", id="second")
+        validator.enter("value")
+        validator.content("2.5")
+        validator.leave()
+        validator.leave()
+        validator.close()
+        
+        self.assertEqual(1, self.val1)
+        self.assertEqual(2.5, self.val2)
+
+
+    def test_recompile(self):
+        validator= Validator(self.context, compiled=True)
+        validator.open()
+        # replaces compiled state of value3
+        self.context.section.insert(node("value3") << ref(self, "val5", int))
+        validator.open()
+        validator.enter("root")
+        validator.enter("section")
+        validator.enter("value3")
+        validator.content("5")
+        validator.leave()
+        validator.leave()
+        validator.leave()
+        validator.close()
+
+        self.assertEqual(5, self.val5)
+        self.assertIsNone(self.val3)
+
+
+    def test_validator(self):
+        with self.assertRaises(ValueError):
+            Validator(self.context, profiler=Profiler(), compiled=True)
+
+        def convert(string=None):
+            if string is None:
+                return 0
+            raise SchemaError("nested", SimpleNamespace(line=42, column=1))
+
+        self.context.section.insert(node("value5") << ref(self, "val5",
+                                                          convert))
+        validator= Validator(self.context, compiled=True)
+
+        for enter in (lambda name: validator.enter(name),
+                      lambda name: validator.events([(ENTER, (name, {}))])):
+            validator.open()
+            validator.enter("root")
+            validator.enter("section")
+            validator.enter("value5")
+            validator.content("5")
+            with self.assertRaises(SchemaError) as env:
+                enter("value6")
+            self.assertEqual("nested", env.exception.message)
+            self.assertEqual(42, env.exception.line)
+
+        # content of the aborted document is discarded
+        validator.open()
+        validator.enter("root")
+        validator.enter("value1")
+        validator.content("1")
+        validator.leave()
+        validator.leave()
+        validator.close()
+        self.assertEqual(1, self.val1)
+
+
+    def test_deferredReset(self):
+        # same results as generic validator, though child groups are reset
+        # lazily
+        documents= [[("root", {}), ("value1", {}), "1", None,
+                     ("section", {}), ("value3", {}), "a", None, None, None],
+                    [("root", {}), ("value1", {}), "2", None, None],
+                    [("root", {}), ("section", {}), ("value4", {}), "b", None,
+                     None, None],
+                    [("root", {}), ("section", {"resetChildren": False}),
+                     ("value3", {}), "c", None, None, None]]
+
+        for compiled in (False, True):
+            validator= Validator(self.context, compiled=compiled)
+            values= list()
+
+            for document in documents:
+                validator.open()
+                for event in document:
+                    if event is None:
+                        validator.leave()
+                    elif isinstance(event, str):
+                        validator.content(event)
+                    else:
+                        validator.enter(event[0], **event[1])
+                validator.close()
+                values.append((self.val1, self.val3, self.val4))
+
+            if compiled:
+                self.assertEqual(values, expected)
+            else:
+                expected= values
+                self.assertEqual(values[1], (2, "", ""))
+                self.assertEqual(values[3], (0, "c", ""))
+
+
+
 def suite():
     """Get Test suite object
     """
-    return unittest.TestLoader().loadTestsFromTestCase(SchemaTestCase)
+    loader= unittest.TestLoader()
+    return unittest.TestSuite([
+        loader.loadTestsFromTestCase(SchemaTestCase),
+        loader.loadTestsFromTestCase(CompiledSchemaTestCase)
+    ])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from schema import Schema, node
+from schema.schema_reader import SchemaReader
+from schema.mixins import children, ref, lst
+from schema.content_handler import ContentHandler, ENTER, LEAVE, CONTENT
+
+
+class Recorder(ContentHandler):
+    """Content handler recording all events"""
+    def __init__(self):
+        self.record= []
+
+    def open(self):
+        self.record.append(("open",))
+
+    def close(self):
+        self.record.append(("close",))
+
+    def enter(self, name, **kwargs):
+        self.record.append(("enter", name, kwargs))
+
+    def leave(self):
+        self.record.append(("leave",))
+
+    def content(self, content):
+        self.record.append(("content", content))
+
+
+class SchemaReaderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.val1 = 1
+        self.val2 = [2, 3]
+        self.val3 = "three"
+        self.context= node("root") << children()[
+                        node("value1") << ref(self, "val1", int),
+                        node("section") << children() [
+                          node("value2") << lst(self, "val2", int),
+                          node("value3") << ref(self, "val3")
+                        ]
+                      ]
+        self.schema= Schema(self.context)
+
+
+    def test_events(self):
+        events= list(SchemaReader(None).events(self.schema))
+        self.assertEqual(events, [
+            (ENTER, ("root", {})), (CONTENT, ""),
+            (ENTER, ("value1", {})), (CONTENT, "1"), (LEAVE, None),
+            (ENTER, ("section", {})), (CONTENT, ""),
+            (ENTER, ("value2", {})), (CONTENT, "2"), (LEAVE, None),
+            (ENTER, ("value2", {})), (CONTENT, "3"), (LEAVE, None),
+            (ENTER, ("value3", {})), (CONTENT, "three"), (LEAVE, None),
+            (LEAVE, None),
+            (LEAVE, None)
+        ])
+
+
+    def test_call(self):
+        recorder= Recorder()
+        SchemaReader(recorder, batchSize=4)(self.schema)
+        self.assertEqual(("open",), recorder.record[0])
+        self.assertEqual(("close",), recorder.record[-1])
+        self.assertEqual(("enter", "value2", {}), recorder.record[11])
+        self.assertEqual(("content", "3"), recorder.record[12])
+        self.assertEqual(20, len(recorder.record))
+
+
+    def test_content(self):
+        recorder= Recorder()
+        SchemaReader(recorder)(self.schema)
+        self.assertEqual(recorder.record, [
+            ("open",),
+            ("enter", "root", {}), ("content", ""),
+            ("enter", "value1", {}), ("content", "1"), ("leave",),
+            ("enter", "section", {}), ("content", ""),
+            ("enter", "value2", {}), ("content", "2"), ("leave",),
+            ("enter", "value2", {}), ("content", "3"), ("leave",),
+            ("enter", "value3", {}), ("content", "three"), ("leave",),
+            ("leave",),
+            ("leave",),
+            ("close",)
+        ])
+        # reading must not reset the content of the data model
+        self.assertEqual(self.val2, [2, 3])
+
+
+    def test_deep(self):
+        depth= 5000
+        root= node("n0") << children()
+        ctx= root
+        for i in range(1, depth):
+            child= node("n{}".format(i)) << children()
+            ctx.insert(child)
+            ctx= child
+
+        recorder= Recorder()
+        SchemaReader(recorder)(Schema(root))
+        self.assertEqual(3 * depth + 2, len(recorder.record))
+        self.assertEqual(("enter", "n4999", {}), recorder.record[-depth - 3])
+
+
+
+def suite():
+    """Get Test suite object
+    """
+    return unittest.TestLoader().loadTestsFromTestCase(SchemaReaderTestCase)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run( suite() )
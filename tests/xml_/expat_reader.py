@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import unittest
+import os
+
+from io import BytesIO
+from tempfile import TemporaryDirectory
+
+from schema import Validator, SchemaError, node
+from schema.mixins import children, ref, lst, proxy
+from schema.xml import ExpatReader
+
+
+class ExpatReaderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.val1= 0
+        self.val2= 0.
+        self.val3= False
+        self.val4= []
+        self.context= node("root") << children()[
+                        node("value1") << ref(self, "val1", int),
+                        node("value2") << ref(self, "val2", float),
+                        node("section") << children() [
+                          node("value3") << ref(self, "val3"),
+                          node("value4") << lst(self, "val4", int),
+                        ],
+                        node("value") << proxy(key="key")[
+                            node("value5") << ref(self, "val5", int),
+                            node("value6") << ref(self, "val6", float)
+                        ]
+                      ]
+        self.reader= ExpatReader(Validator(self.context), bufferSize=16)
+
+
+    text1= bytes(
+        '<?xml version="1.0" encoding="UTF-8" standalone="no" ?>\n'
+        '<root>\r\n'
+        '  <value1>5</value1>\r\n'
+        '  <value2>1.23</value2>\n'
+        '  <section>\n'
+        '    <value3>on &amp; off</value3>\n'
+        '    <value4>1</value4>\n'
+        '    <value4>2</value4>\n'
+        '    <value4>42</value4>\n'
+        '  </section>\n'
+        '  <!-- comment -->\n'
+        '  <value key="value5">5</value>\n'
+        '  <value key="value6">6.6</value>\n'
+        '</root>'.encode("utf-8") )
+
+
+    def check(self):
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val2, 1.23)
+        self.assertEqual(self.val3, "on & off")
+        self.assertEqual(self.val4, [1, 2, 42])
+        self.assertEqual(self.val5, 5)
+        self.assertEqual(self.val6, 6.6)
+
+
+    def test_parseBuffer(self):
+        self.reader.parseBuffer(self.text1)
+        self.check()
+
+        # next chunk fed starts a new document
+        self.val4= []
+        self.reader.feed(self.text1.replace(b"<value1>5", b"<value1>7"))
+        self.reader.close()
+        self.assertEqual(self.val1, 7)
+        self.assertEqual(self.val4, [1, 2, 42])
+
+
+    def test_parse(self):
+        self.reader.parse(BytesIO(self.text1))
+        self.check()
+
+        with TemporaryDirectory() as tmpDir:
+            path= os.path.join(tmpDir, "test.xml")
+            with open(path, "wb") as f:
+                f.write(self.text1.replace(b"<value1>5", b"<value1>7"))
+            self.reader.parseFile(path)
+
+        self.assertEqual(self.val1, 7)
+
+
+    def test_feed(self):
+        for size in (1, 7, 100):
+            self.val4= []
+            for begin in range(0, len(self.text1), size):
+                self.reader.feed(self.text1[begin:begin + size])
+            self.reader.close()
+            self.check()
+
+        # errors are reported as soon as the offending chunk is fed
+        lines= self.text1.replace(b"<value1>5", b"<value1>x").splitlines(True)
+        self.reader.feed(lines[0])
+        self.reader.feed(lines[1])
+        with self.assertRaises(SchemaError) as env:
+            self.reader.feed(lines[2])
+        self.assertEqual(env.exception.line, 3)
+
+        # reader starts a new document after an error
+        self.reader.feed(self.text1)
+        self.reader.close()
+        self.check()
+
+        with self.assertRaises(SchemaError):
+            self.reader.close()
+
+
+    def test_errors(self):
+        with self.assertRaises(SchemaError) as env:
+            self.reader.parseBuffer(self.text1.replace(b"<value4>1</value4>",
+                                                       b"<value4>1"))
+        self.assertEqual(env.exception.line, 8)
+        self.assertIn("Context 'value4' does not support children",
+                      str(env.exception))
+
+        with self.assertRaises(SchemaError) as env:
+            self.reader.parseBuffer(b"<root>\n  <value1>5</value2>\n</root>")
+        self.assertEqual(env.exception.line, 2)
+        self.assertIn("mismatched tag", str(env.exception))
+
+
+
+def suite():
+    """Get Test suite object
+    """
+    return unittest.TestLoader().loadTestsFromTestCase(ExpatReaderTestCase)
+
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run( suite() )
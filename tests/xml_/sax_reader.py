@@ -6,6 +6,7 @@ from schema.mixins import children, ref, lst, proxy
 from schema.xml import SaxReader
 from schema import SchemaError
 
+import asyncio
 from io import StringIO
 from xml.sax import parseString
 
@@ -66,6 +67,57 @@ class SaxReaderTestCase(unittest.TestCase):
         self.assertEqual(self.stdout.getvalue(), "")
 
 
+    def test_parseAsync(self):
+        data= bytes(
+            '<?xml version="1.0" encoding="UTF-8" standalone="no" ?>\n'
+            '<root>\n'
+            '  <value1>5</value1>\n'
+            '  <section>\n'
+            '    <value4>1</value4>\n'
+            '    <value4>42</value4>\n'
+            '  </section>\n'
+            '  <value key="value6">6.6</value>\n'
+            '</root>'.encode("utf-8") )
+
+        async def chunks():
+            for begin in range(0, len(data), 50):
+                yield data[begin:begin + 50]
+
+        asyncio.run(self.reader.parseAsync(chunks(), chunkSize=16))
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val4, [1, 42])
+        self.assertEqual(self.val6, 6.6)
+
+
+    def test_feed(self):
+        data= bytes(
+            '<?xml version="1.0" encoding="UTF-8" standalone="no" ?>\n'
+            '<root>\n'
+            '  <value1>5</value1>\n'
+            '  <section>\n'
+            '    <value4>1</value4>\n'
+            '    <value4>42</value4>\n'
+            '  </section>\n'
+            '</root>'.encode("utf-8") )
+
+        for begin in range(0, len(data), 3):
+            self.reader.feed(data[begin:begin + 3])
+        self.reader.close()
+        self.assertEqual(self.val1, 5)
+        self.assertEqual(self.val4, [1, 42])
+
+        lines= data.replace(b"<value1>5", b"<value1>x").splitlines(True)
+        self.reader.feed(lines[0])
+        self.reader.feed(lines[1])
+        with self.assertRaises(SchemaError) as env:
+            self.reader.feed(lines[2])
+        self.assertEqual(env.exception.line, 3)
+
+        self.reader.feed(data)
+        self.reader.close()
+        self.assertEqual(self.val4, [1, 42])
+
+
     def test_case2(self):
         str1= bytes(
             '<?xml version="1.0" encoding="UTF-8" standalone="no" ?>\n'
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 import unittest
 
-from io import StringIO
+from io import StringIO, BytesIO
 
 from xml.sax import parseString
+from xml.sax.saxutils import XMLGenerator
 from schema.xml import SaxReader, XmlWriter
 
 
@@ -50,6 +51,42 @@ class XmlWriterTestCase(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+    def test_escape(self):
+        def write(writer):
+            writer.open()
+            writer.enter("root")
+            writer.enter("value", a='q"uo', b="it's", c="<&\t")
+            writer.content("a & b < c > d \u00e4 \u20ac")
+            writer.leave()
+            writer.comment(" comment ")
+            writer.leave()
+            writer.close()
+
+        expected= StringIO()
+        generator= XMLGenerator(expected, encoding="ascii")
+        generator.startDocument()
+        generator.startElement("root", {})
+        generator.ignorableWhitespace("\n  ")
+        generator.startElement("value", {"a": 'q"uo', "b": "it's",
+                                         "c": "<&\t"})
+        generator.characters("a & b < c > d \u00e4 \u20ac")
+        generator.endElement("value")
+        generator.ignorableWhitespace("\n  <!-- comment -->\n")
+        generator.endElement("root")
+        generator.ignorableWhitespace("\n")
+        generator.endDocument()
+
+        write(XmlWriter(os=self.stdout, encoding="ascii"))
+        self.assertEqual(self.stdout.getvalue(), expected.getvalue())
+
+        out= BytesIO()
+        write(XmlWriter(os=out, encoding="ascii", bufferSize=1))
+        self.assertEqual(out.getvalue(),
+                         expected.getvalue().encode("ascii",
+                                                    "xmlcharrefreplace"))
+        self.assertIn(b"d &#228; &#8364;</value>", out.getvalue())
+
+
     def test_case2(self):
         self.skipTest("YamlReader not yet functional")
         str1= StringIO( 